@@ -0,0 +1,58 @@
+"""
+Benchmark of deep_merge on 6-level configs with 100k leaves.
+
+Compares deep_merge with recursive merge copying every subtree::
+
+    $ python -m benchmarks.bench_deep_merge
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import dicttools
+
+BRANCHES = 7
+LEVELS = 6
+REPEAT = 3
+
+
+def build(level, overridden):
+    if level == LEVELS - 1:
+        return {'leaf%d' % i: i for i in range(BRANCHES - 1)}
+
+    if overridden:
+        return {'node0': build(level + 1, True)}
+
+    return {'node%d' % i: build(level + 1, False) for i in range(BRANCHES)}
+
+
+def copying_merge(first, second):
+    result = {key: copying_merge(value, {}) if isinstance(value, dict) else value for key, value in first.items()}
+
+    for key, value in second.items():
+        if isinstance(value, dict):
+            result[key] = copying_merge(result.get(key, {}), value)
+        else:
+            result[key] = value
+
+    return result
+
+
+def count_leaves(d):
+    return sum(count_leaves(value) if isinstance(value, dict) else 1 for value in d.values())
+
+
+def main():
+    base = build(0, False)
+    override = build(0, True)
+
+    print('leaves: %d' % count_leaves(base))
+
+    for name, function in [('copying', copying_merge), ('deep_merge', dicttools.deep_merge)]:
+        best = min(timeit.repeat(lambda: function(base, override), number=1, repeat=REPEAT))
+        print('%-12s %10.3f ms' % (name, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark of split with 10 conditions on 10^6 keys.
+
+Compares single pass split with splitting the remainder once per condition::
+
+    $ python -m benchmarks.bench_split
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import dicttools
+from dicttools.functions import _split_two
+
+SIZE = 10 ** 6
+CONDITIONS = 10
+REPEAT = 3
+
+
+def chained_split(dictionary, *conditions):
+    result = []
+
+    for condition in conditions:
+        selected, dictionary = _split_two(dictionary, condition)
+        result.append(selected)
+
+    result.append(dictionary)
+    return result
+
+
+def make_condition(remainder):
+    return lambda key: key % CONDITIONS == remainder
+
+
+def main():
+    dictionary = dict.fromkeys(range(SIZE), 'value')
+    conditions = [make_condition(remainder) for remainder in range(CONDITIONS)]
+
+    for name, function in [('chained', chained_split), ('split_eager', dicttools.split_eager)]:
+        best = min(timeit.repeat(lambda: function(dictionary, *conditions), number=1, repeat=REPEAT))
+        print('%-12s %8.3f s' % (name, best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,431 @@
+"""
+Benchmark cases of the public dicttools API, used by ``benchmarks.suite``.
+
+Each case is a function, which takes the size of data (number of items) and returns a callable
+without arguments, which is timed. Cases of operations, which modify their input, are registered
+with fresh=True and return a factory of such callables, each prepared on a new copy of data,
+so that only the operation itself is timed.
+
+The part of case name before a dot is the benchmarked function or class, e.g. ``merge``
+or ``FrozenDict.getitem``.
+"""
+
+import collections
+import functools
+import math
+import operator
+
+import six
+
+import dicttools
+from dicttools.multidimensional import MultiDict, NamedMultiDict
+
+from .bench_split import make_condition, CONDITIONS
+
+GROUPS = 100
+
+Case = collections.namedtuple('Case', 'name, make, fresh')
+Record = collections.namedtuple('Record', 'id, group, value')
+
+CASES = collections.OrderedDict()
+
+
+def case(name, fresh=False):
+    def decorator(make):
+        CASES[name] = Case(name, make, fresh)
+        return make
+
+    return decorator
+
+
+def is_even(key):
+    return key % 2 == 0
+
+
+def numbers(size, offset=0):
+    return dict(zip(range(size), range(offset, offset + size)))
+
+
+def records(size):
+    return [Record(i, i % GROUPS, i) for i in range(size)]
+
+
+def rows(size):
+    return [{'id': i, 'group': i % GROUPS, 'value': i} for i in range(size)]
+
+
+def nested(size, override=False):
+    width = 10
+    return {
+        'section%d' % i: {'key%d' % j: -j if override else j for j in range(width)}
+        for i in range(0, max(size // width, 1), 2 if override else 1)
+    }
+
+
+def grid(size):
+    # rectangular, because MultiDict created from dict takes headers from the greatest key
+    side = max(each for each in range(1, int(math.sqrt(size)) + 1) if size % each == 0)
+    return {(i // side, i % side): i for i in range(size)}
+
+
+# functions
+
+
+@case('two_way')
+def bench_two_way(size):
+    return functools.partial(dicttools.two_way, numbers(size, size))
+
+
+@case('swap')
+def bench_swap(size):
+    return functools.partial(dicttools.swap, numbers(size))
+
+
+@case('by')
+def bench_by(size):
+    return functools.partial(dicttools.by, 'id', records(size))
+
+
+@case('group_by')
+def bench_group_by(size):
+    return functools.partial(dicttools.group_by, 'group', records(size))
+
+
+@case('reduce_by')
+def bench_reduce_by(size):
+    return functools.partial(dicttools.reduce_by, 'group', records(size), 'sum')
+
+
+@case('stream_group_by')
+def bench_stream_group_by(size):
+    elements = records(size)
+    return lambda: [list(group) for _, group in dicttools.stream_group_by('group', elements)]
+
+
+@case('stream_group_by.spill')
+def bench_stream_group_by_spill(size):
+    elements = records(size)
+    return lambda: [list(group) for _, group in dicttools.stream_group_by('group', elements, size // 4 or 1)]
+
+
+@case('select')
+def bench_select(size):
+    return functools.partial(dicttools.select, numbers(size), list(range(0, size, 2)))
+
+
+@case('extract')
+def bench_extract(size):
+    return functools.partial(dicttools.extract, 1 + 2j, ['real', 'imag'] * (size // 2))
+
+
+@case('projector')
+def bench_projector(size):
+    project, data = dicttools.projector('id', 'value'), rows(size)
+    return lambda: list(project.stream(data))
+
+
+@case('merge')
+def bench_merge(size):
+    return functools.partial(dicttools.merge, numbers(size), numbers(size // 2, 1))
+
+
+@case('merge.func')
+def bench_merge_func(size):
+    return functools.partial(dicttools.merge, operator.add, numbers(size), numbers(size // 2, 1))
+
+
+@case('merge_many')
+def bench_merge_many(size):
+    return functools.partial(dicttools.merge_many, [numbers(size), numbers(size // 2, 1), numbers(size // 4, 2)])
+
+
+@case('merge_into', fresh=True)
+def bench_merge_into(size):
+    target, source = numbers(size), numbers(size // 2, 1)
+    return lambda: functools.partial(dicttools.merge_into, dict(target), source)
+
+
+@case('deep_merge')
+def bench_deep_merge(size):
+    return functools.partial(dicttools.deep_merge, nested(size), nested(size, override=True))
+
+
+@case('split')
+def bench_split(size):
+    dictionary = numbers(size)
+    return lambda: list(dicttools.split(dictionary, is_even))
+
+
+@case('split_eager')
+def bench_split_eager(size):
+    conditions = [make_condition(remainder) for remainder in range(CONDITIONS)]
+    return functools.partial(dicttools.split_eager, numbers(size), *conditions)
+
+
+@case('sift')
+def bench_sift(size):
+    return functools.partial(dicttools.sift, numbers(size), is_even)
+
+
+@case('sift_update', fresh=True)
+def bench_sift_update(size):
+    dictionary = numbers(size)
+    return lambda: functools.partial(dicttools.sift_update, dict(dictionary), is_even)
+
+
+@case('contains')
+def bench_contains(size):
+    return functools.partial(dicttools.contains, numbers(size // 2), numbers(size))
+
+
+@case('deep_contains')
+def bench_deep_contains(size):
+    return functools.partial(dicttools.deep_contains, nested(size // 2), nested(size))
+
+
+@case('map_values')
+def bench_map_values(size):
+    return functools.partial(dicttools.map_values, abs, numbers(size))
+
+
+@case('map_keys')
+def bench_map_keys(size):
+    return functools.partial(dicttools.map_keys, abs, numbers(size))
+
+
+@case('map_values_update', fresh=True)
+def bench_map_values_update(size):
+    dictionary = numbers(size)
+    return lambda: functools.partial(dicttools.map_values_update, abs, dict(dictionary))
+
+
+@case('map_keys_update', fresh=True)
+def bench_map_keys_update(size):
+    dictionary = numbers(size)
+    return lambda: functools.partial(dicttools.map_keys_update, abs, dict(dictionary))
+
+
+@case('find_key')
+def bench_find_key(size):
+    return functools.partial(dicttools.find_key, size - 1, numbers(size))
+
+
+@case('find_keys')
+def bench_find_keys(size):
+    return functools.partial(dicttools.find_keys, size - 1, numbers(size))
+
+
+@case('fill_value')
+def bench_fill_value(size):
+    return functools.partial(dicttools.fill_value, list(range(size)), 0)
+
+
+@case('fill_factory')
+def bench_fill_factory(size):
+    return functools.partial(dicttools.fill_factory, list(range(size)), list)
+
+
+@case('zip_dict')
+def bench_zip_dict(size):
+    return functools.partial(dicttools.zip_dict, list(range(size)), list(range(size)))
+
+
+@case('from_columns')
+def bench_from_columns(size):
+    return functools.partial(dicttools.from_columns, id=list(range(size)), value=list(range(size)))
+
+
+@case('to_columns')
+def bench_to_columns(size):
+    return functools.partial(dicttools.to_columns, rows(size))
+
+
+@case('stringify')
+def bench_stringify(size):
+    return functools.partial(dicttools.stringify, nested(size))
+
+
+@case('stringify_to')
+def bench_stringify_to(size):
+    dictionary = nested(size)
+    return lambda: dicttools.stringify_to(six.StringIO(), dictionary)
+
+
+@case('fingerprint')
+def bench_fingerprint(size):
+    return functools.partial(dicttools.fingerprint, nested(size))
+
+
+@case('list_of_values')
+def bench_list_of_values(size):
+    return functools.partial(dicttools.list_of_values, numbers(size), list(range(0, 2 * size, 2)))
+
+
+@case('values_getter')
+def bench_values_getter(size):
+    return functools.partial(dicttools.values_getter(['value', 'id', 'missing']).rows, rows(size))
+
+
+# containers
+
+
+@case('FrozenDict.init')
+def bench_frozen_dict_init(size):
+    return functools.partial(dicttools.FrozenDict, numbers(size))
+
+
+@case('FrozenDict.getitem')
+def bench_frozen_dict_getitem(size):
+    frozen = dicttools.FrozenDict(numbers(size))
+    return lambda: list(map(frozen.__getitem__, range(size)))
+
+
+@case('FrozenDict.hash')
+def bench_frozen_dict_hash(size):
+    return functools.partial(hash, dicttools.FrozenDict(numbers(size)))
+
+
+@case('ChainMap.getitem')
+def bench_chain_map_getitem(size):
+    chain = dicttools.ChainMap([numbers(size // 2), numbers(size, 1)])
+    return lambda: list(map(chain.__getitem__, range(size)))
+
+
+@case('ChainMap.iter')
+def bench_chain_map_iter(size):
+    return functools.partial(list, dicttools.ChainMap([numbers(size // 2), numbers(size, 1)]))
+
+
+@case('TwoWayDict.init')
+def bench_two_way_dict_init(size):
+    return functools.partial(dicttools.TwoWayDict, numbers(size, size))
+
+
+@case('TwoWayDict.setitem', fresh=True)
+def bench_two_way_dict_setitem(size):
+    keys = range(size)
+
+    def prepare():
+        container = dicttools.TwoWayDict()
+        return lambda: list(map(container.__setitem__, keys, range(size, 2 * size)))
+
+    return prepare
+
+
+@case('TwoWayDict.getitem')
+def bench_two_way_dict_getitem(size):
+    container = dicttools.TwoWayDict(numbers(size, size))
+    return lambda: list(map(container.__getitem__, range(2 * size)))
+
+
+@case('ReverseIndex.init')
+def bench_reverse_index_init(size):
+    return functools.partial(dicttools.ReverseIndex, numbers(size))
+
+
+@case('ReverseIndex.find_keys')
+def bench_reverse_index_find_keys(size):
+    index = dicttools.ReverseIndex(numbers(size))
+    return lambda: list(map(index.find_keys, range(size)))
+
+
+# views and pipeline
+
+
+@case('MappedValuesView')
+def bench_mapped_values_view(size):
+    return functools.partial(dict, dicttools.MappedValuesView(abs, numbers(size)))
+
+
+@case('SiftedView')
+def bench_sifted_view(size):
+    return functools.partial(dict, dicttools.SiftedView(numbers(size), is_even))
+
+
+@case('Pipeline')
+def bench_pipeline(size):
+    pipeline = dicttools.Pipeline(numbers(size)).merge(numbers(size // 2, 1)).sift(is_even).map_values(abs)
+    return pipeline.collect
+
+
+# multidimensional
+
+
+@case('MultiDict.init')
+def bench_multi_dict_init(size):
+    return functools.partial(MultiDict, grid(size))
+
+
+@case('MultiDict.from_flat')
+def bench_multi_dict_from_flat(size):
+    return functools.partial(MultiDict.from_flat, grid(size))
+
+
+@case('MultiDict.pivot')
+def bench_multi_dict_pivot(size):
+    return functools.partial(MultiDict.pivot, records(size), ['group', 'id'], value='value')
+
+
+@case('MultiDict.getitem')
+def bench_multi_dict_getitem(size):
+    data = grid(size)
+    instance = MultiDict(data)
+    return lambda: list(map(instance.__getitem__, data))
+
+
+@case('MultiDict.setitem')
+def bench_multi_dict_setitem(size):
+    data = grid(size)
+    instance = MultiDict(data)
+    return lambda: list(map(instance.__setitem__, data, range(size)))
+
+
+@case('MultiDict.reduce')
+def bench_multi_dict_reduce(size):
+    instance = MultiDict(grid(size))
+    return lambda: instance[0].reduce()
+
+
+@case('MultiDict.digest', fresh=True)
+def bench_multi_dict_digest(size):
+    data = grid(size)
+
+    def prepare():
+        instance = MultiDict(data)
+        return lambda: instance.digest
+
+    return prepare
+
+
+@case('MultiDict.items')
+def bench_multi_dict_items(size):
+    return MultiDict(grid(size)).items
+
+
+@case('MultiDict.merge')
+def bench_multi_dict_merge(size):
+    data = grid(size)
+    return functools.partial(MultiDict(data).merge, MultiDict(data))
+
+
+@case('MultiDict.map_values')
+def bench_multi_dict_map_values(size):
+    return functools.partial(MultiDict(grid(size)).map_values, abs)
+
+
+@case('MultiDict.to_nested')
+def bench_multi_dict_to_nested(size):
+    return MultiDict(grid(size)).to_nested
+
+
+@case('MultiDict.eq')
+def bench_multi_dict_eq(size):
+    data = grid(size)
+    return functools.partial(operator.eq, MultiDict(data), MultiDict(dict(data)))
+
+
+@case('NamedMultiDict.get')
+def bench_named_multi_dict_get(size):
+    data = grid(size)
+    instance = NamedMultiDict(data, names=('row', 'column'))
+    return lambda: [instance.get(row=row, column=column) for row, column in data]
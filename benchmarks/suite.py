@@ -0,0 +1,253 @@
+"""
+Microbenchmarks of the public dicttools API at sizes from 10^2 to 10^6 items.
+
+Run all cases (or only the ones matching a pattern) and write results as JSON::
+
+    $ python -m benchmarks.suite run -o before.json
+    $ python -m benchmarks.suite run -o after.json -k merge --sizes 100,10000
+
+Compare two runs; cases slower by more than the threshold are reported as regressions
+and the exit status is 1::
+
+    $ python -m benchmarks.suite compare before.json after.json --threshold 0.1
+
+List cases and the public functions and classes, which are not covered::
+
+    $ python -m benchmarks.suite list
+
+Each result keeps the best time of a single call from all repeats, which is the least
+affected by other processes. ``bench_split`` and ``bench_deep_merge`` compare the chosen
+implementations with their alternatives and are run separately.
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import fnmatch
+import gc
+import inspect
+import json
+import platform
+import sys
+import timeit
+
+import dicttools
+import dicttools.functions
+import dicttools.multidimensional
+
+from .cases import CASES
+
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+REPEAT = 5
+MIN_TIME = 0.2
+MAX_LOOPS = 10 ** 6
+MAX_FRESH_ITEMS = 2 * 10 ** 6
+FORMAT_VERSION = 1
+
+
+def measure(case, size, repeat=REPEAT, min_time=MIN_TIME):
+    """
+    Time the case of the given size. Number of calls in single repeat is increased tenfold,
+    until they take at least min_time (or the limit of calls is reached).
+
+    :return: dict with number of calls in each repeat (loops) and times of single call
+    """
+    prepare = case.make(size)
+
+    if case.fresh:
+        # every call gets its own copy of data, so limit the number of items kept at once
+        max_loops = max(MAX_FRESH_ITEMS // size, 1)
+    else:
+        run = prepare
+        prepare = lambda: run
+        max_loops = MAX_LOOPS
+
+    loops = 1
+
+    while True:
+        elapsed = _time_calls(prepare, loops)
+
+        if elapsed >= min_time or loops * 10 > max_loops:
+            break
+
+        loops *= 10
+
+    times = [elapsed] + [_time_calls(prepare, loops) for _ in range(repeat - 1)]
+
+    return {'loops': loops, 'times': [each / loops for each in times]}
+
+
+def _time_calls(prepare, loops):
+    calls = [prepare() for _ in range(loops)]
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        start = timeit.default_timer()
+
+        for call in calls:
+            call()
+
+        return timeit.default_timer() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def run(names, sizes, repeat=REPEAT, min_time=MIN_TIME, out=sys.stdout):
+    results = []
+
+    for name in names:
+        for size in sizes:
+            result = measure(CASES[name], size, repeat, min_time)
+            result.update(name=name, size=size, best=min(result['times']))
+            results.append(result)
+
+            print('%-28s %8d %12s' % (name, size, _format_time(result['best'])), file=out)
+
+    return {
+        'version': FORMAT_VERSION,
+        'date': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'benchmarks': results,
+    }
+
+
+def compare(old, new, threshold=0.1, out=sys.stdout):
+    """
+    Compare best times of cases present in both runs.
+
+    :return: list of (name, size, ratio) of cases, which are slower than 1 + threshold times
+    """
+    old_times = {(each['name'], each['size']): each['best'] for each in old['benchmarks']}
+    regressions = []
+
+    print('%-28s %8s %12s %12s %8s' % ('case', 'size', 'old', 'new', 'ratio'), file=out)
+
+    for each in new['benchmarks']:
+        key = each['name'], each['size']
+
+        if key not in old_times:
+            continue
+
+        ratio = each['best'] / old_times[key]
+
+        if ratio > 1 + threshold:
+            mark = 'slower'
+            regressions.append(key + (ratio,))
+        elif ratio < 1 / (1 + threshold):
+            mark = 'faster'
+        else:
+            mark = ''
+
+        print('%-28s %8d %12s %12s %7.2fx %s' % (
+            key + (_format_time(old_times[key]), _format_time(each['best']), ratio, mark)
+        ), file=out)
+
+    return regressions
+
+
+def uncovered():
+    """
+    Return names of public functions and classes of dicttools, which have no benchmark case.
+    """
+    covered = set(name.split('.')[0] for name in CASES)
+    modules = [dicttools.functions, dicttools.containers, dicttools.multidimensional, dicttools.views,
+               dicttools.pipeline]
+    public = set()
+
+    for module in modules:
+        for name, value in vars(module).items():
+            if name.startswith('_') or getattr(value, '__module__', None) != module.__name__:
+                continue
+
+            if inspect.isfunction(value) or inspect.isclass(value):
+                public.add(name)
+
+    return sorted(public - covered)
+
+
+def select_cases(patterns):
+    if not patterns:
+        return list(CASES)
+
+    return [name for name in CASES if any(fnmatch.fnmatch(name, '*%s*' % pattern) for pattern in patterns)]
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return '%.3f %s' % (seconds / scale, unit)
+
+    return '%.1f ns' % (seconds / 1e-9)
+
+
+def _sizes(text):
+    return tuple(int(float(each)) for each in text.split(','))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command')
+
+    run_parser = commands.add_parser('run', help='run benchmarks and write JSON results')
+    run_parser.add_argument('-o', '--output', help='JSON file for results (default only print)')
+    run_parser.add_argument('-k', dest='patterns', action='append', help='run only cases containing pattern')
+    run_parser.add_argument('--sizes', type=_sizes, default=SIZES, help='comma separated sizes (default 1e2..1e6)')
+    run_parser.add_argument('--repeat', type=int, default=REPEAT, help='repeats of each case (default %d)' % REPEAT)
+    run_parser.add_argument('--min-time', type=float, default=MIN_TIME,
+                            help='minimal time of single repeat in seconds (default %s)' % MIN_TIME)
+
+    compare_parser = commands.add_parser('compare', help='compare two JSON results')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='relative slowdown reported as regression (default 0.1)')
+
+    commands.add_parser('list', help='list cases and not covered public names')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(select_cases(args.patterns), args.sizes, args.repeat, args.min_time)
+
+        if args.output:
+            with open(args.output, 'w') as fp:
+                json.dump(results, fp, indent=1)
+
+    elif args.command == 'compare':
+        with open(args.old) as fp:
+            old = json.load(fp)
+
+        with open(args.new) as fp:
+            new = json.load(fp)
+
+        regressions = compare(old, new, args.threshold)
+
+        if regressions:
+            print('\n%d regression(s) above %d%%' % (len(regressions), args.threshold * 100))
+            return 1
+
+    elif args.command == 'list':
+        for name in CASES:
+            print(name)
+
+        missing = uncovered()
+
+        if missing:
+            print('\nnot covered: %s' % ', '.join(missing))
+            return 1
+
+    else:
+        parser.print_help()
+        return 2
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
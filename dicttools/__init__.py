@@ -7,6 +7,8 @@ but do not modify already existed values.
 
 from .containers import *
 from .functions import *
+from .views import *
+from .pipeline import *
 
 __author__ = 'Leszek Trzemecki'
 
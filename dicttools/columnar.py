@@ -0,0 +1,150 @@
+"""
+Dict functions operating on columns of keys and values.
+
+Keys and values are given as parallel sequences (NumPy arrays, ``array.array``, lists, ...)
+and processed by NumPy at once, instead of element by element. The dict is created only at the end.
+Requires NumPy.
+"""
+
+import numpy
+
+_SELECTOR_KINDS = ('key', 'value', 'item')
+
+
+def by(keys, values):
+    """
+    Create a new dict with the given values assigned to keys at the same positions.
+    If a key repeats, the last value is taken::
+
+        >>> by(numpy.array([1, 2, 1]), numpy.array([10, 20, 30]))
+        {1: 30, 2: 20}
+
+    :param keys: column of keys
+    :param values: column of values
+    :return: dict with values assigned to keys
+    """
+
+    keys, values = _columns(keys, values)
+
+    return dict(zip(keys.tolist(), values.tolist()))
+
+
+def group_by(keys, values):
+    """
+    Create a new dict containing arrays of values grouped by keys at the same positions.
+    Groups are found by stable sort, so values in each group keep the original order,
+    and the dict is ordered by keys::
+
+        >>> result = group_by(numpy.array([2, 1, 2, 1]), numpy.array([10, 20, 30, 40]))
+        >>> {key: group.tolist() for key, group in result.items()}
+        {1: [20, 40], 2: [10, 30]}
+
+    :param keys: column of keys
+    :param values: column of values
+    :return: dict with array of values, assigned to each key
+    """
+
+    keys, values = _columns(keys, values)
+
+    order = numpy.argsort(keys, kind='stable')
+    unique, starts = numpy.unique(keys[order], return_index=True)
+
+    return dict(zip(unique.tolist(), numpy.split(values[order], starts[1:])))
+
+
+def map_values(function, keys, values):
+    """
+    Transform all values at once using the given vectorized function. Return a new dict with transformed values::
+
+        >>> map_values(numpy.negative, numpy.array([1, 2]), numpy.array([10, 20]))
+        {1: -10, 2: -20}
+
+    :param function: values map function, taking and returning array
+    :param keys: column of keys
+    :param values: column of values
+    :return: dict with changed values
+    """
+
+    keys, values = _columns(keys, values)
+
+    return by(keys, function(values))
+
+
+def map_keys(function, keys, values):
+    """
+    Transform all keys at once using the given vectorized function. Return a new dict with transformed keys::
+
+        >>> map_keys(numpy.negative, numpy.array([1, 2]), numpy.array([10, 20]))
+        {-1: 10, -2: 20}
+
+    :param function: keys map function, taking and returning array
+    :param keys: column of keys
+    :param values: column of values
+    :return: dict with changed (mapped) keys
+    """
+
+    keys, values = _columns(keys, values)
+
+    return by(function(keys), values)
+
+
+def sift(keys, values, condition, opposite=False, by='key'):
+    """
+    Select only the keys for which the vectorized condition is True::
+
+        >>> sift(numpy.array([1, 2, 3]), numpy.array([10, 20, 30]), lambda k: k % 2 == 1)
+        {1: 10, 3: 30}
+
+        >>> sift(numpy.array([1, 2, 3]), numpy.array([10, 20, 30]), lambda v: v > 15, by='value')
+        {2: 20, 3: 30}
+
+    :param keys: column of keys
+    :param values: column of values
+    :param condition: function taking array of keys, array of values or both (see by),
+        and returning array of bools
+    :param opposite: if True replace "condition" by "not condition" (default False)
+    :param by: 'key', 'value' or 'item' - what is given to condition (default 'key')
+    :return: dict of elements which fulfilled given condition.
+    """
+
+    keys, values = _columns(keys, values)
+
+    if by == 'key':
+        mask = condition(keys)
+    elif by == 'value':
+        mask = condition(values)
+    elif by == 'item':
+        mask = condition(keys, values)
+    else:
+        raise ValueError('Unknown selector %r, expected one of %r' % (by, _SELECTOR_KINDS))
+
+    mask = numpy.asarray(mask, dtype=bool)
+
+    if opposite:
+        mask = ~mask
+
+    return dict(zip(keys[mask].tolist(), values[mask].tolist()))
+
+
+def fill_value(keys, value):
+    """
+    Return a dict with the given value assigned to each given key::
+
+        >>> fill_value(numpy.array([1, 2, 3]), 'a')
+        {1: 'a', 2: 'a', 3: 'a'}
+
+    :param keys: column of keys
+    :param value: value, which should be assigned to each key
+    :return: dict with value assigned do each given key
+    """
+
+    return dict.fromkeys(numpy.asarray(keys).tolist(), value)
+
+
+def _columns(keys, values):
+    keys, values = numpy.asarray(keys), numpy.asarray(values)
+
+    if len(keys) != len(values):
+        raise ValueError('Columns have different lengths: %d keys and %d values' % (len(keys), len(values)))
+
+    return keys, values
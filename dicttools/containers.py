@@ -2,6 +2,8 @@ import bisect
 import collections
 import itertools
 
+import six
+
 try:
     from collections.abc import Mapping, MutableMapping
 except ImportError:
@@ -217,8 +219,24 @@ class TwoWayDict(MutableMapping):
         self._direct = {}
         self._reversed = {}
 
-        for key, value in dict(*args, **kwargs).items():
-            self[key] = value
+        content = dict(*args, **kwargs)
+
+        if not self._init_unique(content):
+            for key, value in content.items():
+                self[key] = value
+
+    def _init_unique(self, content):
+        reversed_content = {value: key for key, value in content.items() if value != key}
+
+        if len(reversed_content) + sum(1 for key, value in content.items() if value == key) != len(content):
+            return False
+
+        if six.viewkeys(reversed_content) & six.viewkeys(content):
+            return False
+
+        self._direct = content
+        self._reversed = reversed_content
+        return True
 
     def __iter__(self):
         return itertools.chain(iter(self._direct), iter(self._reversed))
@@ -266,3 +284,104 @@ class TwoWayDict(MutableMapping):
 
     def __repr__(self):
         return 'TwoWayDict(%r)' % self._direct
+
+
+class ReverseIndex(object):
+    """
+    Index of keys by values of dict, for many lookups of keys by value.
+    Built in single pass, then each lookup of hashable value is O(1),
+    only unhashable values are searched linearly. All keys with the value are found::
+
+        >>> index = ReverseIndex({'a': 1, 'b': 2, 'c': 1})
+        >>> index.find_keys(1)
+        ['a', 'c']
+        >>> index.find_key(2)
+        'b'
+        >>> index.find_key(3, default='x')
+        'x'
+
+    Index does not follow changes of dict, but it can be updated incrementally::
+
+        >>> index.add('d', 2)
+        >>> index.find_keys(2)
+        ['b', 'd']
+        >>> index.discard('b', 2)
+        >>> index.find_keys(2)
+        ['d']
+    """
+
+    def __init__(self, dictionary=None):
+        """
+        :param dictionary: dict which values are indexed (default None - empty index)
+        """
+        self._keys = {}
+        self._unhashable = []
+
+        if dictionary is not None:
+            for key, value in dictionary.items():
+                self.add(key, value)
+
+    def add(self, key, value):
+        """
+        Add association of value with key.
+        """
+        try:
+            self._keys.setdefault(value, []).append(key)
+        except TypeError:
+            self._unhashable.append((key, value))
+
+    def discard(self, key, value):
+        """
+        Remove association of value with key if exists.
+        """
+        try:
+            keys = self._keys.get(value)
+        except TypeError:
+            self._unhashable = [each for each in self._unhashable if each != (key, value)]
+            return
+
+        if keys is not None and key in keys:
+            keys.remove(key)
+
+            if not keys:
+                del self._keys[value]
+
+    def find_keys(self, value):
+        """
+        Find all keys, which given value is assigned to.
+
+        :param value: value, which for are searched keys
+        :return: list of keys (empty if value is not found)
+        """
+        try:
+            return list(self._keys.get(value, ()))
+        except TypeError:
+            return [key for key, each in self._unhashable if each == value]
+
+    def find_key(self, value, default=None):
+        """
+        Find the first key, which given value is assigned to.
+
+        :param value: value, which for is searched a key
+        :param default: value returned if value is not found (default None)
+        :return: key which value is assigned to
+        """
+        keys = self.find_keys(value)
+        return keys[0] if keys else default
+
+    def __contains__(self, value):
+        return bool(self.find_keys(value))
+
+    def __len__(self):
+        return sum(map(len, self._keys.values())) + len(self._unhashable)
+
+    def __repr__(self):
+        return 'ReverseIndex(%r)' % dict(self._items())
+
+    def _items(self):
+        for value, keys in self._keys.items():
+            for key in keys:
+                yield key, value
+
+        for each in self._unhashable:
+            yield each
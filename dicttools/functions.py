@@ -1,14 +1,25 @@
 import collections
+import copy
 import functools
+import hashlib
 import operator
 import inspect
+import itertools
+import marshal
+import os
+import pickle
+import tempfile
+
+import six
 
 try:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping, Set
 except ImportError:
-    from collections import Iterable
+    from collections import Iterable, Mapping, Set
+
+from .containers import TwoWayDict
 
-def two_way(dictionary):
+def two_way(dictionary, as_container=False):
     """
     Create a new dict containing two-way associations (values to keys and keys to values)
     from the given dictionary::
@@ -16,27 +27,76 @@ def two_way(dictionary):
         >>> two_way({'A': 1, 'B': 2})
         {'A': 1, 1: 'A', 2: 'B', 'B': 2}
 
+    When a value is also a key of the given dictionary, association from the given dictionary is kept.
+
     :param dict dictionary: one way association dict
+    :param as_container: if True return TwoWayDict instead of dict (default False)
     :return: two way association dict
     """
-    return merge(swap(dictionary), dictionary)
+
+    if as_container:
+        return TwoWayDict(dictionary)
+
+    result = swap(dictionary)
+    result.update(dictionary)
+
+    return result
 
 
-def swap(dictionary):
+_DUPLICATE_POLICIES = ('last', 'first', 'error', 'collect')
+
+
+def swap(dictionary, on_duplicate='last'):
     """
     Create a new dict with the given dictionary keys as values and values as keys::
 
         >>> stringify(swap({0: 'A', 1: 'B', 2: 'C'}))
         '{A:0, B:1, C:2}'
 
+    When the value is assigned to many keys, the last key is taken by default. It can be changed
+    by on_duplicate parameter::
+
+        >>> swap({0: 'A', 1: 'B', 2: 'A'}, on_duplicate='first')
+        {'A': 0, 'B': 1}
+
+        >>> swap({0: 'A', 1: 'B', 2: 'A'}, on_duplicate='collect')
+        {'A': [0, 2], 'B': [1]}
+
     :param dict dictionary: dict to swap
+    :param on_duplicate: 'last', 'first', 'error' (ValueError is raised) or 'collect' (list of all keys
+        is assigned to each value) - what to do with values assigned to many keys (default 'last')
     :return: new swapped dict
     """
 
-    return {value: key for key, value in dictionary.items()}
+    if on_duplicate == 'last':
+        return {value: key for key, value in dictionary.items()}
+    elif on_duplicate == 'first':
+        result = {}
+
+        for key, value in dictionary.items():
+            result.setdefault(value, key)
 
+        return result
+    elif on_duplicate == 'error':
+        result = {value: key for key, value in dictionary.items()}
 
-def by(key, *elements):
+        if len(result) != len(dictionary):
+            duplicated = [value for value, keys in swap(dictionary, 'collect').items() if len(keys) > 1]
+            raise ValueError('Values assigned to many keys: %r' % duplicated)
+
+        return result
+    elif on_duplicate == 'collect':
+        result = collections.defaultdict(list)
+
+        for key, value in dictionary.items():
+            result[value].append(key)
+
+        return dict(result)
+    else:
+        raise ValueError('Unknown policy %r, expected one of %r' % (on_duplicate, _DUPLICATE_POLICIES))
+
+
+def by(key, *elements, **kwargs):
     """
     Create a new dict with the given elements as values,
     and the keys determined by the given parameter function::
@@ -50,19 +110,38 @@ def by(key, *elements):
         >>> by(lambda x:int(x), "123", "456")
         {456: '456', 123: '123'}
 
+    When an executor (from ``concurrent.futures``) is given, elements are split into chunks
+    and keys are evaluated in parallel. The result is the same as in serial version.
+    For process pools the key must be picklable (e.g. attribute name or module level function).
+
 
     :param elements: iterable of elements or elements as varargs
     :param key: attribute, by which element could be accessed or lambda function
+    :param executor: executor used to evaluate keys of chunks in parallel (default None - serial)
+    :param chunksize: number of elements in single chunk given to executor (default 1000)
     :return: dict with elements, assigned to extracted key
+    :raise ValueError: if chunksize is less than 1
     """
 
-    if not callable(key):
-        key = operator.attrgetter(key)
+    executor = kwargs.get('executor')
+
+    if executor is None:
+        return _by_chunk(key, _iter_all_or_first(elements))
+
+    result = {}
+
+    for partial in _map_chunks(executor, _by_chunk, key, elements, kwargs.get('chunksize', 1000)):
+        result.update(partial)
+
+    return result
+
 
-    return {key(element): element for element in _iter_all_or_first(elements)}
+def _by_chunk(key, elements):
+    key = _key_function(key)
+    return {key(element): element for element in elements}
 
 
-def group_by(key, *elements):
+def group_by(key, *elements, **kwargs):
     """
     Create a new dict containing elements grouped by the given key.
     Returns a dict of list of values, with the same extracted key assigned to this key::
@@ -70,22 +149,236 @@ def group_by(key, *elements):
         >>> group_by('real', 2j, 0-3j, (-5+0j), (-3+2j), (-5+15j))
         {0.0: [2j, -3j], -5.0: [(-5+0j), (-5+15j)], -3.0: [(-3+2j)]}
 
+    When an executor (from ``concurrent.futures``) is given, elements are split into chunks
+    grouped independently in parallel. Partial groups are joined in order of chunks,
+    so the result is the same as in serial version.
+    For process pools the key must be picklable (e.g. attribute name or module level function).
+
     :param elements: list or tuple of elements
     :param key: attribute, by which element could be accessed or lambda function
+    :param executor: executor used to group chunks in parallel (default None - serial)
+    :param chunksize: number of elements in single chunk given to executor (default 1000)
     :return: dict with list of elements, assigned to extracted key
+    :raise ValueError: if chunksize is less than 1
     """
 
-    if not callable(key):
-        key = operator.attrgetter(key)
+    executor = kwargs.get('executor')
+
+    if executor is None:
+        return dict(_group_chunk(key, _iter_all_or_first(elements)))
 
     result = collections.defaultdict(list)
 
-    for each in _iter_all_or_first(elements):
-        result[key(each)].append(each)
+    for partial in _map_chunks(executor, _group_chunk, key, elements, kwargs.get('chunksize', 1000)):
+        for each, group in partial.items():
+            result[each].extend(group)
 
     return dict(result)
 
 
+def _group_chunk(key, elements):
+    # key is given as is and resolved here, because attrgetter can not be pickled on Python 2
+    key = _key_function(key)
+    result = collections.defaultdict(list)
+
+    for each in elements:
+        result[key(each)].append(each)
+
+    return result
+
+
+def _map_chunks(executor, function, key, elements, chunksize):
+    if chunksize < 1:
+        raise ValueError('Chunk size must be at least 1, got %r' % (chunksize,))
+
+    chunks = _chunks(_iter_all_or_first(elements), chunksize)
+
+    return executor.map(function, itertools.repeat(key), chunks)
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(itertools.islice(iterator, size))
+
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, size))
+
+
+_MISSING = object()
+
+
+def reduce_by(key, elements, reducer='count', **kwargs):
+    """
+    Group elements by the given key, but keep only the aggregated value of each group instead of
+    list of elements, so the elements can be consumed from iterator of any size::
+
+        >>> reduce_by('real', iter([2j, 0-3j, (-5+0j), (-3+2j), (-5+15j)]))
+        {0.0: 2, -5.0: 2, -3.0: 1}
+
+        >>> reduce_by(len, ['a', 'bc', 'de', 'f'], 'last')
+        {1: 'f', 2: 'de'}
+
+        >>> reduce_by(len, ['a', 'bc', 'de', 'f'], lambda total, word: total + word, initial='')
+        {1: 'af', 2: 'bcde'}
+
+    :param key: attribute, by which element could be accessed or lambda function
+    :param elements: iterable of elements
+    :param reducer: 'count', 'sum', 'first', 'last' or two arguments function:
+        (aggregated value, element) -> new aggregated value (default 'count')
+    :param initial: initial aggregated value of each group given to reducer function, copied for each group,
+        so it can be modified by reducer (default the first element of group)
+    :return: dict with aggregated value, assigned to extracted key
+    """
+
+    key = _key_function(key)
+
+    if reducer == 'count':
+        return dict(collections.Counter(map(key, elements)))
+    elif reducer == 'first':
+        result = {}
+
+        for element in elements:
+            result.setdefault(key(element), element)
+
+        return result
+    elif reducer == 'last':
+        return {key(element): element for element in elements}
+    elif reducer == 'sum':
+        reducer = operator.add
+    elif not callable(reducer):
+        raise ValueError('Unknown reducer %r' % (reducer,))
+
+    initial = kwargs.get('initial', _MISSING)
+    result = {}
+
+    for element in elements:
+        element_key = key(element)
+        aggregated = result.get(element_key, _MISSING)
+
+        if aggregated is _MISSING:
+            if initial is _MISSING:
+                result[element_key] = element
+                continue
+
+            aggregated = copy.copy(initial)
+
+        result[element_key] = reducer(aggregated, element)
+
+    return result
+
+
+def stream_group_by(key, elements, max_in_memory=None):
+    """
+    Works like group_by, but consumes elements from iterable and yields pairs of key and iterator
+    of group elements, in order of first occurrence, when the input is exhausted::
+
+        >>> [(k, list(group)) for k, group in stream_group_by(len, iter(['a', 'bc', 'de', 'f']))]
+        [(1, ['a', 'f']), (2, ['bc', 'de'])]
+
+    When more than max_in_memory elements are kept, all of them are spilled (pickled) to a temporary
+    file, from which spilled elements of each group are read back while iterating the group.
+    The file is removed, when the generator and all taken group iterators are exhausted or closed,
+    so groups can be read in any order, also after the generator is exhausted.
+
+    :param key: attribute, by which element could be accessed or lambda function
+    :param elements: iterable of elements
+    :param max_in_memory: maximal number of elements kept in memory (default None - no limit)
+    :return: generator of pairs: key and iterator of elements assigned to this key
+    """
+
+    key = _key_function(key)
+
+    if max_in_memory is None:
+        groups = collections.OrderedDict()
+
+        for element in elements:
+            groups.setdefault(key(element), []).append(element)
+
+        for each, group in groups.items():
+            yield each, iter(group)
+
+        return
+
+    buffers = collections.OrderedDict()
+    offsets = collections.defaultdict(list)
+    spill = _SpillFile()
+    count = 0
+
+    try:
+        for element in elements:
+            buffers.setdefault(key(element), []).append(element)
+            count += 1
+
+            if count > max_in_memory:
+                _spill_groups(buffers, offsets, spill)
+                count = 0
+
+        for each, group in buffers.items():
+            if each in offsets:
+                spill.acquire()
+                yield each, itertools.chain(_load_group(spill, offsets[each]), group)
+            else:
+                yield each, iter(group)
+    finally:
+        spill.release()
+
+
+class _SpillFile(object):
+    """
+    Temporary file shared by stream_group_by and its group iterators, closed (and so removed)
+    when the last of them releases it.
+    """
+
+    def __init__(self):
+        self._stream = None
+        self._users = 1
+
+    def write(self, group):
+        if self._stream is None:
+            self._stream = tempfile.TemporaryFile(prefix='dicttools-')
+
+        self._stream.seek(0, os.SEEK_END)
+        offset = self._stream.tell()
+        pickle.dump(group, self._stream, pickle.HIGHEST_PROTOCOL)
+
+        return offset
+
+    def read(self, offset):
+        # other group iterators may read in between, so the position is set before each chunk
+        self._stream.seek(offset)
+        return pickle.load(self._stream)
+
+    def acquire(self):
+        self._users += 1
+
+    def release(self):
+        self._users -= 1
+
+        if not self._users and self._stream is not None:
+            self._stream.close()
+
+
+def _spill_groups(buffers, offsets, spill):
+    for each, group in buffers.items():
+        if group:
+            offsets[each].append(spill.write(group))
+            buffers[each] = []
+
+
+def _load_group(spill, offsets):
+    try:
+        for offset in offsets:
+            for element in spill.read(offset):
+                yield element
+    finally:
+        spill.release()
+
+
+def _key_function(key):
+    return key if callable(key) else operator.attrgetter(key)
+
+
 def select(source, *keys):
     """
     Create a new dict containing only the selected keys from the source dictionary.
@@ -117,6 +410,108 @@ def extract(source, *elements, **kwargs):
     return {value: extractor(source, value) for value in _iter_all_or_first(elements)}
 
 
+def projector(*keys, **kwargs):
+    """
+    Create a function, which works like select (or extract) with the given keys, but is built once,
+    so it is faster for projection of many records::
+
+        >>> project = projector('a', 'c')
+        >>> stringify(project({'a': 1, 'b': 2, 'c': 4}))
+        '{a:1, c:4}'
+
+    When missing value is given, it is used for keys not found in record, instead of throwing::
+
+        >>> project = projector('a', 'c', missing=0)
+        >>> [stringify(each) for each in project.stream([{'a': 1}, {'c': 3}])]
+        ['{a:1, c:0}', '{a:0, c:3}']
+
+    :param keys: keys which should be selected, as varargs or single iterable (but not single string)
+    :param key: ``operator.getitem``, ``getattr`` or other two arguments function, which extract
+        value of key from record (default ``operator.getitem``)
+    :param missing: value used for keys, which are not found in record (default raise exception)
+    :return: callable record -> dict with selected values, with stream method for iterable of records
+    """
+
+    if keys and not (len(keys) == 1 and isinstance(keys[0], six.string_types)):
+        keys = tuple(_iter_all_or_first(keys))
+
+    return _Projector(keys, kwargs.get('key', operator.getitem), kwargs.get('missing', _MISSING))
+
+
+class _Projector(object):
+    _CHUNK = 1024
+
+    def __init__(self, keys, extractor, missing):
+        self._keys = keys
+        self._missing = missing
+
+        if extractor is operator.getitem and keys:
+            getter = operator.itemgetter(*keys)
+            self._lookups = [operator.itemgetter(each) for each in keys]
+            self._errors = (KeyError, IndexError)
+        elif extractor is getattr and keys:
+            # attrgetter also resolves dotted names, so it is used for single keys too
+            getter = operator.attrgetter(*keys)
+            self._lookups = [operator.attrgetter(each) for each in keys]
+            self._errors = (AttributeError,)
+        else:
+            getter = lambda record: tuple([extractor(record, each) for each in keys])
+            self._lookups = [functools.partial(_extract_key, extractor, each) for each in keys]
+            self._errors = (KeyError, IndexError, AttributeError)
+
+        if len(keys) == 1:
+            self._getter = lambda record: (getter(record),)
+        else:
+            self._getter = getter
+
+    def __call__(self, record):
+        return dict(zip(self._keys, self._values(record)))
+
+    def _values(self, record):
+        if self._missing is _MISSING:
+            return self._getter(record)
+
+        try:
+            return self._getter(record)
+        except self._errors:
+            return [self._value(record, lookup) for lookup in self._lookups]
+
+    def _value(self, record, lookup):
+        try:
+            return lookup(record)
+        except self._errors:
+            return self._missing
+
+    def stream(self, records):
+        """
+        Project each of the given records, consuming them by chunks.
+
+        :param records: iterable of records
+        :return: generator of dicts with selected values
+        """
+        keys = self._keys
+        iterator = iter(records)
+
+        for chunk in iter(lambda: list(itertools.islice(iterator, self._CHUNK)), []):
+            try:
+                rows = list(map(self._getter, chunk))
+            except self._errors:
+                if self._missing is _MISSING:
+                    raise
+
+                rows = list(map(self._values, chunk))
+
+            for values in rows:
+                yield dict(zip(keys, values))
+
+    def __repr__(self):
+        return 'projector(%r)' % (self._keys,)
+
+
+def _extract_key(extractor, key, record):
+    return extractor(record, key)
+
+
 def _iter_all_or_first(elements):
     if len(elements) > 1:
         return iter(elements)
@@ -167,30 +562,155 @@ def merge(*dicts):
     :param dicts: dicts to merge
     :return: dict containing all element from given dicts
     """
-    if len(dicts) == 0:
-        return {}
+    if len(dicts) > 0 and callable(dicts[0]):
+        return merge_many(dicts[1:], dicts[0])
 
-    if callable(dicts[0]):
-        mergefunc = dicts[0]
-        dicts = dicts[1:]
+    return merge_many(dicts)
 
-        def update(result, item):
-            for k, v in item.items():
-                result[k] = mergefunc(result[k], v) if k in result else v
 
+def merge_many(dicts, func=None):
+    """
+    Works like merge, but takes any iterable (also generator) of dicts, so they do not have to be
+    materialized at once::
+
+        >>> d = merge_many(({'A': i, 'B': 1} for i in range(4)), lambda x, y: x + y)
+        >>> stringify(d)
+        '{A:6, B:4}'
+
+    Keys which are present only in one of dicts are copied by ``dict.update``, and the func is
+    called only for keys common with already merged dicts.
+
+    :param dicts: iterable of dicts to merge, None elements are ignored
+    :param func: two arguments function used to merge duplicate values (default value from last dict)
+    :return: dict containing all element from given dicts, of the same type as the first non-None dict
+    """
+
+    dicts = iter(dicts)
+
+    for first in dicts:
+        if first is not None:
+            result = type(first)()
+            _merge_into(result, itertools.chain([first], dicts), func)
             return result
-    else:
-        def update(result, item):
-            result.update(item)
-            return result
+
+    return {}
+
+
+def merge_into(target, *sources, **kwargs):
+    """
+    Works like merge, but modifies the first given dict in place, instead of creating new one::
+
+        >>> d = {'A': 1}
+        >>> merge_into(d, {'B': 2}, {'A': 3}, func=lambda x, y: x + y)
+        >>> stringify(d)
+        '{A:4, B:2}'
+
+    :param target: dict to update
+    :param sources: dicts to merge into target, None elements are ignored
+    :param func: two arguments function used to merge duplicate values (default value from last dict)
+    """
+
+    _merge_into(target, sources, kwargs.get('func'))
+
+
+def _merge_into(result, dicts, func):
+    for each in dicts:
+        if each is None:
+            continue
+
+        if func is None or not result:
+            result.update(each)
+            continue
+
+        common = [key for key in each if key in result]
+
+        if common:
+            merged = {key: func(result[key], each[key]) for key in common}
+            result.update(each)
+            result.update(merged)
+        else:
+            result.update(each)
+
+
+_LIST_STRATEGIES = ('replace', 'append', 'unique')
+
+
+def deep_merge(*dicts, **kwargs):
+    """
+    Merge the given dicts recursively into a single new dict. Nested dicts found under the same key
+    are merged, other values are taken from the last dict containing the key::
+
+        >>> stringify(deep_merge({'a': {'x': 1, 'y': 2}}, {'a': {'y': 3}, 'b': 4}))
+        '{a:{x:1, y:3}, b:4}'
+
+    Only merged nested dicts are copied. Nested dicts present in only one of the given dicts are
+    shared by reference with the result, so they should not be modified afterwards::
+
+        >>> shared = {'x': 1}
+        >>> deep_merge({'a': shared}, {'b': 2})['a'] is shared
+        True
+
+    Lists are replaced by default, they can be also concatenated::
+
+        >>> deep_merge({'a': [1, 2]}, {'a': [2, 3]}, list_strategy='append')
+        {'a': [1, 2, 2, 3]}
+
+        >>> deep_merge({'a': [1, 2]}, {'a': [2, 3]}, list_strategy='unique')
+        {'a': [1, 2, 3]}
+
+    Nested dicts are traversed without recursion, so the depth is not limited by recursion limit.
+
+    :param dicts: dicts to merge, None elements are ignored
+    :param func: two arguments function used to merge duplicate values, which are not dicts
+        (default value from last dict)
+    :param list_strategy: 'replace', 'append' or 'unique' - how to merge lists (default 'replace')
+    :return: dict containing all element from given dicts, of the same type as the first non-None dict
+    """
+
+    func = kwargs.get('func')
+    list_strategy = kwargs.get('list_strategy', 'replace')
+
+    if list_strategy not in _LIST_STRATEGIES:
+        raise ValueError('Unknown list strategy %r, expected one of %r' % (list_strategy, _LIST_STRATEGIES))
 
     dicts = [d for d in dicts if d is not None]
 
     if len(dicts) == 0:
         return {}
 
-    TypeToReturn = type(dicts[0])
-    return functools.reduce(update, dicts, TypeToReturn())
+    result = dicts[0].copy()
+    owned = {id(result): result}
+
+    for source in dicts[1:]:
+        stack = [(result, source)]
+
+        while stack:
+            target, update = stack.pop()
+
+            for key, value in update.items():
+                if key not in target:
+                    target[key] = value
+                    continue
+
+                current = target[key]
+
+                if isinstance(current, dict) and isinstance(value, dict):
+                    if id(current) not in owned:
+                        current = target[key] = current.copy()
+                        owned[id(current)] = current
+
+                    stack.append((current, value))
+                elif list_strategy != 'replace' and isinstance(current, list) and isinstance(value, list):
+                    if list_strategy == 'append':
+                        target[key] = current + value
+                    else:
+                        target[key] = current + [each for each in value if each not in current]
+                elif func is not None:
+                    target[key] = func(current, value)
+                else:
+                    target[key] = value
+
+    return result
 
 
 def split(dictionary, *conditions, **kwargs):
@@ -215,25 +735,46 @@ def split(dictionary, *conditions, **kwargs):
     :param conditions: functions (name matters): key -> bool or  value -> bool or key, value -> bool)
         which decide that element in current result should be included or not
     :param rest: True if should append at end elements which not fulfilled any condition, False otherwise
+    :param by: 'key', 'value' or 'item' - what is given to conditions (default determined by conditions signatures)
     :return: generator for element split according to given condition
     """
 
+    for each in split_eager(dictionary, *conditions, **kwargs):
+        yield each
+
+
+def split_eager(dictionary, *conditions, **kwargs):
+    """
+    Works like split, but returns list of sub-dictionaries. Each element is sent to its sub-dictionary
+    in single pass over the given dictionary::
+
+        >>> split_eager({0: 'A', 1: 'B', 2: 'C', 3: 'D', 4: 'E'}, lambda i: i%3 == 0, lambda i: i%3 == 1)
+        [{0: 'A', 3: 'D'}, {1: 'B', 4: 'E'}, {2: 'C'}]
+
+    :param dictionary: elements to split into other sets of elements
+    :param conditions: functions (name matters): key -> bool or  value -> bool or key, value -> bool)
+        which decide that element in current result should be included or not
+    :param rest: True if should append at end elements which not fulfilled any condition, False otherwise
+    :param by: 'key', 'value' or 'item' - what is given to conditions (default determined by conditions signatures)
+    :return: list of elements split according to given condition
+    """
+
     rest = kwargs.get('rest', True)
+    by = kwargs.get('by')
 
-    for condition in conditions:
-        selected, dictionary = _split_two(dictionary, condition)
-        yield selected
-    if rest:
-        yield dictionary
+    if len(conditions) == 1:
+        result = list(_split_two(dictionary, conditions[0], by))
+    else:
+        result = _split_many(dictionary, conditions, by)
 
+    return result if rest else result[:-1]
 
-def _split_two(dictionary, condition):
-    selector = _selector(condition)
 
+def _split_two(dictionary, condition, by=None):
     yes, no = {}, {}
 
-    for key, value in dictionary.items():
-        if selector(key, value):
+    for (key, value), match in zip(dictionary.items(), _matches(dictionary, condition, by)):
+        if match:
             yes[key] = value
         else:
             no[key] = value
@@ -241,7 +782,33 @@ def _split_two(dictionary, condition):
     return yes, no
 
 
-def sift(dictionary, condition, opposite=False):
+def _split_many(dictionary, conditions, by=None):
+    result = [{} for _ in range(len(conditions) + 1)]
+    tests = [
+        (bucket, condition, _resolve_selector_kind(condition, by))
+        for bucket, condition in zip(result, conditions)
+    ]
+    rest = result[-1]
+
+    for key, value in dictionary.items():
+        for bucket, condition, kind in tests:
+            if kind == 'key':
+                match = condition(key)
+            elif kind == 'value':
+                match = condition(value)
+            else:
+                match = condition(key, value)
+
+            if match:
+                bucket[key] = value
+                break
+        else:
+            rest[key] = value
+
+    return result
+
+
+def sift(dictionary, condition, opposite=False, by=None):
     """
     Select from dictionary only the keys for which the condition is True.
 
@@ -255,41 +822,127 @@ def sift(dictionary, condition, opposite=False):
     :param condition: function (name matters): key -> bool or  value -> bool or key, value -> bool)
         selected remain elements
     :param opposite: if True replace "condition" by "not condition" (default False)
+    :param by: 'key', 'value' or 'item' - what is given to condition (default determined by condition signature)
     :return: subset of elements which fulfilled given condition.
     """
 
-    selector = _selector(condition)
+    opposite = bool(opposite)
 
-    return {key: value for key, value in dictionary.items() if bool(opposite) != bool(selector(key, value))}
+    return {
+        key: value
+        for (key, value), match in zip(dictionary.items(), _matches(dictionary, condition, by))
+        if opposite != bool(match)
+    }
 
 
-def sift_update(dictionary, condition, opposite=False):
+def sift_update(dictionary, condition, opposite=False, by=None):
     """
-    Works like sift, but modifies the given dictionary in place.
+    Works like sift, but modifies the given dictionary in place. Condition is called once for each element.
+    When most of elements are removed, the dictionary is cleared and refilled with the remaining ones.
 
     :param dictionary: set of elements to select subset
     :param condition: function (name matters): key -> bool or  value -> bool or key, value -> bool)
         selected remain elements
     :param opposite: if True replace "condition" by "not condition" (default False)
+    :param by: 'key', 'value' or 'item' - what is given to condition (default determined by condition signature)
     """
 
-    selector = _selector(condition)
+    opposite = bool(opposite)
+    pairs = six.moves.zip(dictionary, _matches(dictionary, condition, by))
+    sample = list(itertools.islice(pairs, _SIFT_SAMPLE))
+    removed = sum(opposite == bool(match) for _, match in sample)
+
+    if removed > len(sample) * _REBUILD_RATIO:
+        # most items go away: keep the few survivors and refill, instead of leaving a sparse table
+        survivors = [(key, dictionary[key]) for key, match in sample if opposite != bool(match)]
+        survivors += [(key, dictionary[key]) for key, match in pairs if opposite != bool(match)]
+        dictionary.clear()
+        dictionary.update(survivors)
+    else:
+        to_delete = [key for key, match in sample if opposite == bool(match)]
+        to_delete += [key for key, match in pairs if opposite == bool(match)]
 
-    for each in list(dictionary):
-        if bool(opposite) == bool(selector(each, dictionary[each])):
+        for each in to_delete:
             del dictionary[each]
 
 
-def _selector(condition):
-    spec = inspect.getargspec(condition)
-    ismethod = inspect.ismethod(condition)
+_SIFT_SAMPLE = 64
+_REBUILD_RATIO = 0.9
+
+
+_SELECTOR_KINDS = ('key', 'value', 'item')
+_VALUE_NAMES = ('v', 'val', 'value')
+_selector_kind_cache = {}
+
+
+def _matches(dictionary, condition, by=None):
+    by = _resolve_selector_kind(condition, by)
+
+    if by == 'key':
+        return map(condition, dictionary.keys())
+    elif by == 'value':
+        return map(condition, dictionary.values())
+    else:
+        return itertools.starmap(condition, dictionary.items())
+
+
+def _resolve_selector_kind(condition, by):
+    if by is None:
+        return _selector_kind(condition)
+    elif by not in _SELECTOR_KINDS:
+        raise ValueError('Unknown selector %r, expected one of %r' % (by, _SELECTOR_KINDS))
+
+    return by
+
+
+def _selector_kind(condition):
+    function = getattr(condition, '__func__', condition)
+    code = getattr(function, '__code__', None)
+
+    if code is None:
+        return _signature_selector_kind(condition)
+
+    cache_key = code, function is not condition
+
+    try:
+        return _selector_kind_cache[cache_key]
+    except KeyError:
+        kind = _selector_kind_cache[cache_key] = _code_selector_kind(*cache_key)
+        return kind
+
+
+def _code_selector_kind(code, bound):
+    args = code.co_varnames[bound:code.co_argcount]
+
+    if code.co_flags & inspect.CO_VARARGS or len(args) == 2:
+        return 'item'
+    elif args and args[0] in _VALUE_NAMES:
+        return 'value'
+    else:
+        return 'key'
+
+
+def _signature_selector_kind(condition):
+    if not hasattr(inspect, 'signature'):
+        # Python 2: builtins and other callables without code are given keys
+        return 'key'
+
+    try:
+        parameters = list(inspect.signature(condition).parameters.values())
+    except (TypeError, ValueError):
+        return 'key'
+
+    if any(each.kind == each.VAR_POSITIONAL for each in parameters):
+        return 'item'
 
-    if spec.varargs or len(spec.args) - ismethod == 2:
-        return lambda key, value: condition(key, value)
-    elif spec.args[ismethod] in ['v', 'val', 'value']:
-        return lambda key, value: condition(value)
+    positional = [each for each in parameters if each.kind in (each.POSITIONAL_ONLY, each.POSITIONAL_OR_KEYWORD)]
+
+    if len(positional) == 2:
+        return 'item'
+    elif positional and positional[0].name in _VALUE_NAMES:
+        return 'value'
     else:
-        return lambda key, value: condition(key)
+        return 'key'
 
 
 def contains(sub, super):
@@ -303,16 +956,64 @@ def contains(sub, super):
         >>> contains({0: 'A', 1: 'B', 2: 'C'}, {0: 'A', 1: 'B'})
         False
 
+    When items of both dicts are sets (items views), they are compared as sets, so the check
+    does not look at values when sub dict is longer. Other mappings (e.g. MultiDict) are checked key by key.
+
     :param dict sub: the dict, which should be included in super dict
     :param dict super: the dict, which should include all elements from sub dict
     :return: true if super contains sub, otherwise false.
     """
 
+    sub_items, super_items = sub.items(), super.items()
+
+    if isinstance(sub_items, Set) and isinstance(super_items, Set):
+        return len(sub_items) <= len(super_items) and sub_items <= super_items
+
     return all(
-        key in super and sub[key] == super[key] for key, value in sub.items()
+        key in super and sub[key] == super[key] for key, value in sub_items
     )
 
 
+def deep_contains(sub, super):
+    """
+    Recursive version of contains. Nested dicts in sub dict have to be included in nested dicts
+    under the same keys in super dict, other values have to be equal::
+
+        >>> deep_contains({'a': {'x': 1}}, {'a': {'x': 1, 'y': 2}, 'b': 3})
+        True
+
+        >>> deep_contains({'a': {'x': 1}}, {'a': {'x': 2, 'y': 2}, 'b': 3})
+        False
+
+    Nested dicts are traversed without recursion, so the depth is not limited by recursion limit.
+
+    :param dict sub: the dict, which should be included in super dict
+    :param dict super: the dict, which should include all elements from sub dict
+    :return: true if super contains sub, otherwise false.
+    """
+
+    stack = [(sub, super)]
+
+    while stack:
+        sub, super = stack.pop()
+
+        if len(sub) > len(super):
+            return False
+
+        for key, value in sub.items():
+            if key not in super:
+                return False
+
+            other = super[key]
+
+            if isinstance(value, Mapping) and isinstance(other, Mapping):
+                stack.append((value, other))
+            elif value != other:
+                return False
+
+    return True
+
+
 def map_values(function, dictionary):
     """
     Transform each value using the given function. Return a new dict with transformed values.
@@ -337,11 +1038,53 @@ def map_keys(function, dictionary):
     return {function(key): value for key, value in dictionary.items()}
 
 
+def map_values_update(function, dictionary):
+    """
+    Works like map_values, but modifies the given dictionary in place::
+
+        >>> d = {'a': 1, 'b': 2}
+        >>> map_values_update(lambda v: v * 10, d)
+        >>> d
+        {'a': 10, 'b': 20}
+
+    :param function: values map function
+    :param dictionary: dictionary to mapping
+    """
+
+    # only values of existing keys are replaced, so the dict is not resized while iterated
+    dictionary.update(zip(dictionary.keys(), map(function, dictionary.values())))
+
+
+def map_keys_update(function, dictionary):
+    """
+    Works like map_keys, but modifies the given dictionary in place.
+    When many keys are mapped to the same key, the value of the last one is kept::
+
+        >>> d = {1: 'a', 2: 'b', 3: 'c'}
+        >>> map_keys_update(lambda k: k % 2, d)
+        >>> d
+        {1: 'c', 0: 'b'}
+
+    Mapped keys may collide with not yet mapped ones, so all values are kept aside in a list
+    and the dict is filled again once.
+
+    :param function: keys map function
+    :param dictionary: dictionary to mapping
+    """
+
+    keys = list(map(function, dictionary))
+    values = list(dictionary.values())
+
+    dictionary.clear()
+    dictionary.update(zip(keys, values))
+
+
 def find_key(value, dictionary, default=None):
     """
     Find the given value in the given dictionary and returns its key.
     If value is not found - return default value (None or given).
-    If many elements can be found - return one of them arbitrarily (the first one found)::
+    If many elements can be found - return one of them arbitrarily (the first one found).
+    For many lookups in the same dictionary use ``ReverseIndex``::
 
         >>> find_key('d', {'a': 'b', 'c': 'd'})
         'c'
@@ -362,6 +1105,23 @@ def find_key(value, dictionary, default=None):
     return default
 
 
+def find_keys(value, dictionary):
+    """
+    Find the given value in the given dictionary and returns all its keys::
+
+        >>> find_keys(1, {'a': 1, 'b': 2, 'c': 1})
+        ['a', 'c']
+
+    For many lookups in the same dictionary use ``ReverseIndex``, which finds keys in O(1).
+
+    :param value: value in dictionary, which for are searching keys
+    :param dictionary: dictionary to search in
+    :return: list of keys which value in dictionary is assigned to (empty if value is not found)
+    """
+
+    return [key for key, item_value in dictionary.items() if value == item_value]
+
+
 def fill_value(keys, value):
     """
     Return a dict with the given value assigned to each given key.
@@ -373,10 +1133,91 @@ def fill_value(keys, value):
     :param value: value, which should be assigned to each key
     :return: dict with value assigned do each given key
     """
-    return {key: value for key in keys}
+    return dict.fromkeys(keys, value)
+
+
+def fill_factory(keys, factory):
+    """
+    Return a dict with a new value, created by calling the factory, assigned to each given key.
+    Unlike fill_value, values are not shared, so it is suitable for mutable values::
+
+        >>> result = fill_factory([1, 2], list)
+        >>> result[1].append('a')
+        >>> result
+        {1: ['a'], 2: []}
+
+    :param keys: keys, which returned dict should contains
+    :param factory: function without arguments, called once for each key
+    :return: dict with new value assigned do each given key
+    """
+    return dict(zip(keys, itertools.starmap(factory, itertools.repeat(()))))
+
+
+def zip_dict(keys, values):
+    """
+    Return a dict with values assigned to keys at the same positions.
+    If a key repeats, the last value is taken::
+
+        >>> zip_dict(['a', 'b', 'a'], [1, 2, 3])
+        {'a': 3, 'b': 2}
+
+    :param keys: sequence of keys
+    :param values: sequence of values, with the same length as keys
+    :return: dict with values assigned to keys
+    :raise ValueError: if keys and values have different lengths
+    """
+    _check_lengths([keys, values])
+    return dict(zip(keys, values))
+
+
+def from_columns(**columns):
+    """
+    Convert columns (sequences of values with the same length) to list of dicts,
+    one for each position::
+
+        >>> from_columns(name=['a', 'b'], size=[1, 2]) == [{'name': 'a', 'size': 1}, {'name': 'b', 'size': 2}]
+        True
+
+    :param columns: sequence of values for each key
+    :return: list of dicts with keys of columns
+    :raise ValueError: if columns have different lengths
+    """
+    names = list(columns)
+    values = [columns[name] for name in names]
+    _check_lengths(values)
+
+    return list(map(dict, six.moves.map(zip, itertools.repeat(names), zip(*values))))
+
+
+def to_columns(dicts, keys=None, default=None):
+    """
+    Convert dicts to columns - list of values for each key. Opposite of from_columns::
 
+        >>> to_columns([{'name': 'a', 'size': 1}, {'name': 'b'}])
+        {'name': ['a', 'b'], 'size': [1, None]}
 
-def stringify(d):
+    :param dicts: sequence of dicts
+    :param keys: keys, which are converted to columns (default keys of the first dict)
+    :param default: value inserted for each missing key (default None)
+    :return: dict with list of values for each key
+    """
+    dicts = list(dicts)
+
+    if keys is None:
+        keys = list(dicts[0]) if dicts else []
+
+    getter = _ValuesGetter(keys, default)
+    return dict(zip(getter._keys, getter.columns(dicts)))
+
+
+def _check_lengths(sequences):
+    lengths = set(len(sequence) for sequence in sequences if hasattr(sequence, '__len__'))
+
+    if len(lengths) > 1:
+        raise ValueError('Sequences have different lengths: %s' % ', '.join(map(str, sorted(lengths))))
+
+
+def stringify(d, memo=None):
     """
     Returns a canonical string representation of the given dict,
     by sorting its items recursively.
@@ -384,13 +1225,252 @@ def stringify(d):
 
         >>> stringify({"a":1,"b":2,"c":{"d":3,"e":4}})
         '{a:1, b:2, c:{d:3, e:4}}'
+
+    Nested dicts are traversed without recursion, so the depth is not limited by recursion limit.
+    When the same nested dict is shared in many places of the structure, give a memo dict, where strings
+    of already represented nested dicts are kept (by identity). Memo can be reused in next calls,
+    until any of contained dicts is modified.
+
+    :param d: dict to represent
+    :param memo: dict for representations of already represented nested dicts (default None - not used)
+    :return: canonical string representation
+    """
+
+    return ''.join(_canonical_pieces(d, memo))
+
+
+def stringify_to(fp, d, memo=None):
+    """
+    Works like stringify, but writes the representation to the given file-like object incrementally,
+    instead of building whole string in memory (unless memo is given)::
+
+        >>> import io
+        >>> stream = io.StringIO()
+        >>> stringify_to(stream, {"b":{"d":3},"a":1})
+        >>> stream.getvalue()
+        '{a:1, b:{d:3}}'
+
+    :param fp: object with write method, to which text is written
+    :param d: dict to represent
+    :param memo: dict for representations of already represented nested dicts (default None - not used)
+    """
+
+    for piece in _canonical_pieces(d, memo):
+        fp.write(piece)
+
+
+_FLUSH_PIECES = 4096
+
+
+def _sorted_items(d):
+    return iter(sorted(d.items(), key=operator.itemgetter(0)))
+
+
+def _canonical_pieces(d, memo):
+    out = ['{']
+    stack = [(_sorted_items(d), out, d)]
+    first = True
+
+    while stack:
+        items, out, current = stack[-1]
+
+        for key, value in items:
+            if memo is None and len(out) > _FLUSH_PIECES:
+                # also within a dict, so wide dicts are written in parts too
+                yield ''.join(out)
+                del out[:]
+
+            if not first:
+                out.append(', ')
+
+            first = False
+
+            if isinstance(value, dict):
+                if memo is not None and id(value) in memo:
+                    out.append('{}:{}'.format(key, memo[id(value)][1]))
+                    continue
+
+                out.append('{}:'.format(key))
+
+                if memo is not None:
+                    out = []
+
+                out.append('{')
+                stack.append((_sorted_items(value), out, value))
+                first = True
+                break
+
+            out.append('{}:{}'.format(key, value))
+        else:
+            stack.pop()
+            out.append('}')
+            first = False
+
+            if memo is not None:
+                text = ''.join(out)
+                memo[id(current)] = current, text
+
+                if stack:
+                    stack[-1][1].append(text)
+                else:
+                    yield text
+
+        if memo is None and len(out) > _FLUSH_PIECES:
+            yield ''.join(out)
+            del out[:]
+
+    if memo is None:
+        yield ''.join(out)
+
+
+def fingerprint(d, algorithm=None, default=None):
     """
-    d2 = {}
+    Returns a hex digest of canonical byte encoding of the given dict, useful as a key for caching
+    or deduplication of dicts. Dicts with the same items (also nested, with lists, tuples, sets
+    and FrozenDicts) have equal fingerprints, regardless of the items order::
+
+        >>> fingerprint({'a': 1, 'b': [1, 2]}) == fingerprint({'b': [1, 2], 'a': 1})
+        True
+        >>> fingerprint({'a': 1}) == fingerprint({'a': '1'})
+        False
 
-    for k, v in d.items():
-        d2[k] = stringify(v) if isinstance(v, dict) else v
+    Contents are converted to canonical form (with sorted items) and encoded by ``marshal`` directly
+    into bytes, by chunks of items of the given dict, without building string representation.
+    Keys and values are compared by exact type, not by ``==``, so ``{1: 'a'}``, ``{1.0: 'a'}``
+    and ``{True: 'a'}`` have different fingerprints, although they are equal dicts. Only subclasses
+    of builtin types (e.g. namedtuples) are encoded as their base types.
+    Values of other types are converted by the default function, like in ``json.dumps``::
 
-    return "{" + ", ".join(["{}:{}".format(k, v) for k, v in sorted(d2.items())]) + "}"
+        >>> import decimal
+        >>> fingerprint({'a': decimal.Decimal('1.5')}, default=str) == fingerprint({'a': '1.5'})
+        True
+
+    Fingerprints are stable between runs of the same Python version.
+
+    :param d: dict to fingerprint
+    :param algorithm: name of algorithm from hashlib (default 'blake2b', or 'sha256' if not available)
+    :param default: function converting value of not supported type to supported one
+        (default None - TypeError is raised)
+    :return: hex digest
+    :raise TypeError: if value of not supported type is found and default is not given
+    """
+
+    digest = hashlib.new(algorithm or _FINGERPRINT_ALGORITHM)
+    digest.update(b'%d:' % len(d))
+
+    items = _canonical_items(d, default)
+
+    for start in range(0, len(items), _FINGERPRINT_CHUNK):
+        chunk = items[start:start + _FINGERPRINT_CHUNK]
+        keys = [key for key, _ in chunk]
+        values = _canonical([value for _, value in chunk], default)
+        digest.update(marshal.dumps((keys, values), _MARSHAL_VERSION))
+
+    return digest.hexdigest()
+
+
+# version 2 is the newest one, which does not depend on identity (references) and interning of objects
+_MARSHAL_VERSION = 2
+_FINGERPRINT_CHUNK = 4096
+_FINGERPRINT_ALGORITHM = 'blake2b' if 'blake2b' in hashlib.algorithms_available else 'sha256'
+_MARSHAL_SCALARS = frozenset((six.text_type, six.binary_type, float, complex, bool, type(None)) + six.integer_types)
+_SCALAR_BASES = (six.text_type, six.binary_type, float, complex) + six.integer_types
+_NATURAL_ORDER_KEYS = ({six.text_type}, {six.binary_type}, {int})
+_SET_TAG, _MAPPING_TAG = 0, 2
+
+
+def _canonical_items(mapping, default=None):
+    if set(map(type, mapping)) in _NATURAL_ORDER_KEYS:
+        return sorted(mapping.items())
+
+    items = [(_canonical(key, default), value) for key, value in mapping.items()]
+    items.sort(key=lambda item: marshal.dumps(item[0], _MARSHAL_VERSION))
+    return items
+
+
+def _canonical_mapping(keys, values):
+    if set(map(type, keys)) in _NATURAL_ORDER_KEYS:
+        return dict(zip(keys, values))
+
+    return StopIteration, _MAPPING_TAG, tuple(zip(keys, values))
+
+
+def _canonical_set(values):
+    return StopIteration, _SET_TAG, tuple(sorted(values, key=lambda value: marshal.dumps(value, _MARSHAL_VERSION)))
+
+
+def _canonical(value, default=None):
+    """
+    Convert value to equivalent object, which can be encoded by marshal, with items in canonical order.
+    Markers with StopIteration are used for types not supported by marshal, because it cannot appear in data.
+    """
+    result = []
+    stack = []
+    values, out, finish = iter((value,)), result, None
+
+    while True:
+        for value in values:
+            kind = type(value)
+
+            if kind in _MARSHAL_SCALARS:
+                out.append(value)
+            elif kind is list or kind is tuple:
+                if set(map(type, value)) <= _MARSHAL_SCALARS:
+                    out.append(value)
+                    continue
+
+                stack.append((values, out, finish))
+                values, out, finish = iter(value), [], kind
+                break
+            elif kind is dict and set(map(type, value)) in _NATURAL_ORDER_KEYS:
+                keys = sorted(value)
+                items = list(map(value.__getitem__, keys))
+
+                if set(map(type, items)) <= _MARSHAL_SCALARS:
+                    out.append(dict(zip(keys, items)))
+                    continue
+
+                stack.append((values, out, finish))
+                values, out, finish = iter(items), [], functools.partial(_canonical_mapping, keys)
+                break
+            elif isinstance(value, Mapping):
+                keys, items = zip(*_canonical_items(value, default)) if value else ((), ())
+
+                if set(map(type, items)) <= _MARSHAL_SCALARS:
+                    out.append(_canonical_mapping(keys, items))
+                    continue
+
+                stack.append((values, out, finish))
+                values, out, finish = iter(items), [], functools.partial(_canonical_mapping, keys)
+                break
+            elif isinstance(value, (list, tuple)):
+                stack.append((values, out, finish))
+                values, out, finish = iter(value), [], list if isinstance(value, list) else tuple
+                break
+            elif isinstance(value, (set, frozenset)):
+                stack.append((values, out, finish))
+                values, out, finish = iter(value), [], _canonical_set
+                break
+            elif isinstance(value, _SCALAR_BASES):
+                out.append(next(base(value) for base in _SCALAR_BASES if isinstance(value, base)))
+            elif default is not None:
+                converted = default(value)
+
+                if type(converted) is kind:
+                    raise TypeError('Default function returned the same type %s' % kind.__name__)
+
+                stack.append((values, out, finish))
+                values, out, finish = iter((converted,)), [], operator.itemgetter(0)
+                break
+            else:
+                raise TypeError('Object of type %s is not supported by fingerprint' % kind.__name__)
+        else:
+            if not stack:
+                return result[0]
+
+            built = finish(out)
+            values, out, finish = stack.pop()
+            out.append(built)
 
 
 def list_of_values(dictionary, list_of_keys, default=None):
@@ -404,11 +1484,91 @@ def list_of_values(dictionary, list_of_keys, default=None):
         >>> list_of_values({"a":1, "b":2, "d":4}, ["d","c","b","a"], default=0)
         [4, 0, 2, 1]
 
+    For many dicts with the same keys use ``values_getter``.
     """
-    result = []
+    return list(six.moves.map(dictionary.get, list_of_keys, itertools.repeat(default)))
 
-    for key in list_of_keys:
-        result.append(dictionary.get(key, default))
 
-    return result
+def values_getter(keys, default=None):
+    """
+    Create a function, which converts a dict to a tuple of values of the given keys,
+    with the default value inserted for each missing key. The function is built once
+    and is faster than list_of_values, when the same keys are used for many dicts::
+
+        >>> get = values_getter(["d", "c", "b", "a"], default=0)
+        >>> get({"a": 1, "b": 2, "d": 4})
+        (4, 0, 2, 1)
+
+    Many dicts can be converted at once to rows or to columns::
+
+        >>> get.rows([{"a": 1, "b": 2, "c": 3, "d": 4}, {"a": 5}])
+        [(4, 3, 2, 1), (0, 0, 0, 5)]
+        >>> get.columns([{"a": 1, "b": 2, "c": 3, "d": 4}, {"a": 5}])
+        [[4, 0], [3, 0], [2, 0], [1, 5]]
+
+    :param keys: keys, which values are taken
+    :param default: value inserted for each missing key (default None)
+    :return: callable dict -> tuple of values, with methods rows and columns
+    """
+
+    return _ValuesGetter(keys, default)
+
+
+class _ValuesGetter(object):
+    _CHUNK = 1024
+
+    def __init__(self, keys, default):
+        self._keys = tuple(keys)
+        self._defaults = (default,) * len(self._keys)
+
+        if len(self._keys) == 1:
+            getter = operator.itemgetter(*self._keys)
+            self._getter = lambda dictionary: (getter(dictionary),)
+        elif self._keys:
+            self._getter = operator.itemgetter(*self._keys)
+        else:
+            self._getter = lambda dictionary: ()
+
+    def __call__(self, dictionary):
+        try:
+            return self._getter(dictionary)
+        except KeyError:
+            return tuple(map(dictionary.get, self._keys, self._defaults))
+
+    def rows(self, dicts):
+        """
+        Convert each of the given dicts to tuple of values.
+
+        :param dicts: iterable of dicts
+        :return: list of tuples of values
+        """
+        result = []
+        iterator = iter(dicts)
+
+        for chunk in iter(lambda: list(itertools.islice(iterator, self._CHUNK)), []):
+            try:
+                values = list(map(self._getter, chunk))
+            except KeyError:
+                values = list(map(self, chunk))
+
+            result.extend(values)
+
+        return result
+
+    def columns(self, dicts):
+        """
+        Convert the given dicts to lists of values, one for each key.
+
+        :param dicts: iterable of dicts
+        :return: list of columns (lists of values) in order of keys
+        """
+        rows = self.rows(dicts)
+
+        if not rows:
+            return [[] for _ in self._keys]
+
+        return list(map(list, zip(*rows)))
+
+    def __repr__(self):
+        return 'values_getter(%r)' % (self._keys,)
 
@@ -1,5 +1,13 @@
+import collections
+import operator
+
+import six
 import six.moves
-from .functions import map_values
+from .functions import map_values, _key_function
+
+_DIGEST_MASK = (1 << 64) - 1
+_NOT_COMPUTED = object()
+_MISSING = object()
 
 
 class MultiDict(object):
@@ -11,10 +19,68 @@ class MultiDict(object):
 
         return result
 
+    @classmethod
+    def pivot(cls, records, axes, value=None, agg=None, **kwargs):
+        """
+        Create a new MultiDict from records grouped by labels, in single pass over records::
+
+            >>> Event = collections.namedtuple('Event', 'day, kind, size')
+            >>> events = [Event(1, 'A', 3), Event(1, 'B', 4), Event(2, 'A', 5), Event(1, 'A', 6)]
+            >>> cube = MultiDict.pivot(events, ['day', 'kind'], value='size', agg=lambda x, y: x + y)
+            >>> cube[1, 'A']
+            9
+
+        :param records: iterable of records
+        :param axes: attributes or functions (one per axis), which extract labels from record
+        :param value: attribute or function, which extract value from record (default whole record)
+        :param agg: two arguments function used to merge values with the same labels
+            (default values are collected into list)
+        :return: MultiDict with aggregated values
+        """
+        labels_of = cls._labels_function(axes)
+        value_of = (lambda record: record) if value is None else _key_function(value)
+
+        groups = collections.OrderedDict()
+
+        if agg is None:
+            for record in records:
+                groups.setdefault(labels_of(record), []).append(value_of(record))
+        else:
+            for record in records:
+                labels = labels_of(record)
+                current = groups.get(labels, _MISSING)
+                groups[labels] = value_of(record) if current is _MISSING else agg(current, value_of(record))
+
+        headers = [list(collections.OrderedDict.fromkeys(each)) for each in zip(*groups)] or [[] for _ in axes]
+
+        result = cls(headers=headers, **kwargs)
+        positions = result._labels
+        result._items = {
+            tuple(axis_positions[label] for axis_positions, label in zip(positions, labels)): aggregated
+            for labels, aggregated in groups.items()
+        }
+
+        return result
+
+    @staticmethod
+    def _labels_function(axes):
+        if all(isinstance(each, six.string_types) for each in axes) and len(axes) > 1:
+            return operator.attrgetter(*axes)
+
+        functions = [_key_function(each) for each in axes]
+
+        if len(functions) == 1:
+            function, = functions
+            return lambda record: (function(record),)
+
+        return lambda record: tuple([function(record) for function in functions])
+
     def __init__(self, data=None, headers=None):
         self._headers = None if headers is None else list(map(list, headers))
+        self._labels = None if headers is None else list(map(self._index_labels, self._headers))
 
         self._items = {}
+        self._digest = _NOT_COMPUTED
 
         if isinstance(data, (tuple, list)):
             self._items = dict(self._roll_array(data))
@@ -41,11 +107,55 @@ class MultiDict(object):
     def size(self):
         return len(self._headers or [])
 
+    @property
+    def digest(self):
+        """
+        Hash of the content, which does not depend on order of labels in headers.
+        Computed at first access and then maintained on each assignment.
+        None if any of values is not hashable (then it is computed again at next access).
+        """
+        if self._digest is _NOT_COMPUTED:
+            digest = self._compute_digest()
+
+            if digest is None:
+                return None
+
+            self._digest = digest
+
+        return self._digest
+
+    def _compute_digest(self):
+        result = 0
+
+        try:
+            for labels, value in self._iter_labeled_items():
+                result += hash((labels, value))
+        except TypeError:
+            return None
+
+        return result & _DIGEST_MASK
+
+    def _update_digest(self, labels, old_value, new_value):
+        if self._digest is _NOT_COMPUTED:
+            return
+
+        try:
+            result = self._digest + hash((labels, new_value))
+
+            if old_value is not _MISSING:
+                result -= hash((labels, old_value))
+        except TypeError:
+            # recomputed at next access, when the unhashable value may be already replaced
+            self._digest = _NOT_COMPUTED
+        else:
+            self._digest = result & _DIGEST_MASK
+
     def items(self):
-        return tuple(
-            (tuple(headers[token] for token, headers in zip(key, self._headers)), value)
-            for key, value in self._items.items()
-        )
+        return tuple(self._iter_labeled_items())
+
+    def _iter_labeled_items(self):
+        for key, value in self._items.items():
+            yield tuple(headers[token] for token, headers in zip(key, self._headers)), value
 
     def __len__(self):
         return len(self._items)
@@ -72,28 +182,45 @@ class MultiDict(object):
             return _MultiDictView(self, key)
 
     def reduce(self, index):
-        index = self.key_index(index)
-        return MultiDict(dict(self._reduce_keys(index)), list(self._reduce_headers(index)))
+        return self._reduce_selection(self._compile_key(index))
+
+    def _reduce_selection(self, selection):
+        return MultiDict(dict(self._reduce_keys(selection)), list(self._reduce_headers(selection)))
 
-    def _reduce_keys(self, request_index):
+    def _reduce_keys(self, selection):
         for source_index, source_value in self._items.items():
             result = []
-            for request_token, source_token in zip(request_index, source_index):
-                if isinstance(request_token, list):
-                    if source_token not in request_token:
+            for request_token, source_token in zip(selection, source_index):
+                if isinstance(request_token, int):
+                    if source_token != request_token:
                         break
-
-                    result.append(source_token)
-                elif source_token != request_token:
+                elif source_token not in request_token:
                     break
+                else:
+                    result.append(source_token)
             else:
                 yield tuple(result), source_value
 
-    def _reduce_headers(self, index):
-        for token, header in zip(index, self._headers):
-            if isinstance(token, list):
+    def _reduce_headers(self, selection):
+        for token, header in zip(selection, self._headers):
+            if not isinstance(token, int):
                 yield header
 
+    def _compile_key(self, key):
+        """
+        Convert key of labels into selection of indices: an index for single label,
+        a range for slice or a set of indices for list, which can be tested in O(1).
+        """
+        return tuple(self._compile_token(token, axis) for axis, token in enumerate(key))
+
+    def _compile_token(self, token, axis):
+        index = self.token_index(token, axis)
+
+        if isinstance(token, list):
+            return frozenset(index)
+
+        return index
+
     def __setitem__(self, key, value):
         if not isinstance(key, tuple):
             key = (key,)
@@ -101,6 +228,7 @@ class MultiDict(object):
         self._init_headers(len(key))
         index = self.key_index(key, insert=True)
 
+        self._update_digest(key, self._items.get(index, _MISSING), value)
         self._items[index] = value
 
     def _init_headers(self, shape):
@@ -112,6 +240,7 @@ class MultiDict(object):
 
         if self._headers is None:
             self._headers = [list(six.moves.range(size + 1)) for size in shape]
+            self._labels = list(map(self._index_labels, self._headers))
         elif len(self._headers) != count:
             raise KeyError('Wrong size %d, expected %d' % (count, len(self._headers)))
 
@@ -120,30 +249,44 @@ class MultiDict(object):
             self.token_index(token, axis, insert) for axis, token in enumerate(key)
         )
 
-    def token_index(self, token, axis, insert=False):
-        headers = self._headers[axis]
+    @staticmethod
+    def _index_labels(header):
+        result = {}
+
+        for index, label in enumerate(header):
+            result.setdefault(label, index)
+
+        return result
 
+    def token_index(self, token, axis, insert=False):
+        """
+        Return index of label in headers of given axis, list of indices for list of labels
+        or range of indices for slice of labels.
+        """
         if isinstance(token, slice):
-            start = 0 if token.start is None else headers.index(token.start)
-            stop = len(headers) if token.stop is None else headers.index(token.stop)
+            start = 0 if token.start is None else self._single_token_index(token.start, axis, False)
+            stop = len(self._headers[axis]) if token.stop is None else self._single_token_index(token.stop, axis, False)
             step = 1 if token.step is None else token.step
 
-            return list(six.moves.range(start, stop, step))
+            return six.moves.range(start, stop, step)
         elif isinstance(token, list):
-            return [self._single_token_index(each, headers, insert) for each in token]
+            return [self._single_token_index(each, axis, insert) for each in token]
         else:
-            return self._single_token_index(token, headers, insert)
+            return self._single_token_index(token, axis, insert)
+
+    def _single_token_index(self, token, axis, insert):
+        labels = self._labels[axis]
 
-    @staticmethod
-    def _single_token_index(token, headers, insert):
         try:
-            return headers.index(token)
-        except ValueError:
+            return labels[token]
+        except KeyError:
             if not insert:
-                raise KeyError(token)
+                raise
 
+        headers = self._headers[axis]
         new_index = len(headers)
         headers.append(token)
+        labels[token] = new_index
         return new_index
 
     def merge(self, other):
@@ -179,14 +322,66 @@ class MultiDict(object):
         return repr(self._items)
 
     def __eq__(self, other):
+        """
+        MultiDict is equal to other MultiDict with the same values assigned to the same labels,
+        regardless of order of labels in headers. Nested lists (or tuples) have no labels,
+        so they are compared with values at positions in headers::
+
+            >>> instance = MultiDict([[1, 2], [3, 4]], headers=[['b', 'a'], ['x', 'y']])
+            >>> instance == [[1, 2], [3, 4]]
+            True
+            >>> instance == MultiDict([[1, 2], [3, 4]])
+            False
+        """
         if isinstance(other, (tuple, list)):
-            other = MultiDict(other)
+            return self._equals_array(other)
 
         if isinstance(other, MultiDict):
-            return self._items == other._items
+            return self._equals_multi_dict(other)
 
         return False
 
+    def _equals_array(self, data):
+        count = 0
+
+        for index, value in self._roll_array(data):
+            if self._items.get(index, _MISSING) != value:
+                return False
+
+            count += 1
+
+        return count == len(self._items)
+
+    def _equals_multi_dict(self, other):
+        if self is other:
+            return True
+
+        if len(self._items) != len(other._items):
+            return False
+
+        if not self._items or self._headers == other._headers:
+            return self._items == other._items
+
+        if len(self._headers or ()) != len(other._headers or ()):
+            return False
+
+        digest, other_digest = self.digest, other.digest
+        if digest is not None and other_digest is not None and digest != other_digest:
+            return False
+
+        return self._items == dict(self._remap_items(other))
+
+    def _remap_items(self, other):
+        """
+        Yield items of other MultiDict with indices translated to positions of the same labels in own headers.
+        """
+        translations = [
+            [labels.get(label, _MISSING) for label in headers] for labels, headers in zip(self._labels, other._headers)
+        ]
+
+        for index, value in other._items.items():
+            yield tuple(map(operator.getitem, translations, index)), value
+
     def __ne__(self, other):
         return not self == other
 
@@ -196,10 +391,7 @@ class _DictView(object):
         raise NotImplementedError
 
     def __eq__(self, other):
-        if isinstance(other, (tuple, list)):
-            other = MultiDict(other)
-
-        if isinstance(other, MultiDict):
+        if isinstance(other, (tuple, list, MultiDict)):
             return self.reduce() == other
 
         return False
@@ -215,91 +407,149 @@ class _DictView(object):
 
 
 class _MultiDictView(_DictView):
-    def __init__(self, source, key):
+    """
+    Part of MultiDict selected by chain of keys. Chain is compiled once into single selection
+    (index, range or set of indices per axis), which is reused until headers of source grow.
+    """
+
+    def __init__(self, source, key, parent=None, selection=None):
         self._source = source
         self._key = key
+        self._parent = parent
+        self._selection = selection
+        self._shape = None if selection is None else source.shape
+
+    @property
+    def _compiled(self):
+        shape = self._source.shape
+
+        if self._selection is None or self._shape != shape:
+            if self._parent is None:
+                self._selection = self._source._compile_key(self._key)
+            else:
+                self._selection = self._parent._refine(self._key)
+
+            self._shape = shape
+
+        return self._selection
 
     def __getitem__(self, key):
-        return self._source[self._merge_key_with(key)]
+        selection = self._refine(key)
+
+        if all(isinstance(token, int) for token in selection):
+            return self._source._items[selection]
+
+        return _MultiDictView(self._source, key, self, selection)
 
     def __setitem__(self, key, value):
-        self._source[self._merge_key_with(key)] = value
+        selection = self._refine(key)
+
+        if not all(isinstance(token, int) for token in selection):
+            raise KeyError(key)
+
+        self._source[tuple(header[token] for token, header in zip(selection, self._source._headers))] = value
 
     def reduce(self, key=None):
-        return self._source.reduce(
-            self._key if key is None else self._merge_key_with(key)
+        return self._source._reduce_selection(
+            self._compiled if key is None else self._refine(key)
         )
 
-    def _merge_key_with(self, other_key):
+    def _refine(self, other_key):
         if not isinstance(other_key, tuple):
             other_key = (other_key,)
 
         result = []
 
         iter_keys = iter(other_key)
-        for axis, item in enumerate(self._key):
-            if isinstance(item, (slice, list)):
+        for axis, selected in enumerate(self._compiled):
+            if not isinstance(selected, int):
                 try:
-                    reduced_item = next(iter_keys)
-                    self._check_contains(axis, item, other_key, reduced_item)
-                    result.append(reduced_item)
-                    continue
+                    token = next(iter_keys)
                 except StopIteration:
                     pass
+                else:
+                    selected = self._refine_token(axis, selected, token, other_key)
 
-            result.append(item)
+            result.append(selected)
 
         return tuple(result)
 
-    def _check_contains(self, axis, item, other_key, reduced_item):
-        indices = self._source.token_index(item, axis)
-        if isinstance(reduced_item, slice):
-            reduced_indices = set(self._source.token_index(reduced_item, axis))
+    def _refine_token(self, axis, selected, token, other_key):
+        if isinstance(token, slice):
+            if token == slice(None):
+                return selected
+
+            index = self._source.token_index(token, axis)
 
-            if set(indices) | reduced_indices != reduced_indices:
+            # xrange of Python 2 has no start, stop and step, so it goes through a set of indices
+            steps = getattr(selected, 'step', None), getattr(index, 'step', None)
+
+            if isinstance(selected, six.moves.range) and steps == (1, 1):
+                return six.moves.range(max(selected.start, index.start), min(selected.stop, index.stop))
+
+            return frozenset(each for each in index if each in selected)
+
+        index = self._source.token_index(token, axis)
+
+        if isinstance(token, list):
+            if not all(each in selected for each in index):
                 raise KeyError(other_key)
 
-        elif self._source.token_index(reduced_item, axis) not in indices:
+            return frozenset(index)
+
+        if index not in selected:
             raise KeyError(other_key)
 
+        return index
+
 
 class _NamedMixin(object):
     _names = ()
+    _axes = {}
+    _key_template = ()
 
     def __getitem__(self, item):
         raise NotImplementedError
 
+    def _init_names(self, names):
+        self._names = names
+        self._axes = {name: axis for axis, name in enumerate(names or ())}
+        self._key_template = (slice(None),) * len(self._axes)
+
     def get(self, **kwargs):
-        key = self._keywords_to_key(kwargs)
+        key, names = self._keywords_to_key(kwargs)
         result = self[key]
 
         if isinstance(result, _DictView):
-            return _NamedMultiDictViewDecorator(result, self._reduce_names(key))
+            return _NamedMultiDictViewDecorator(result, names)
 
         return result
 
     def _keywords_to_key(self, kwargs):
-        key = []
+        key = list(self._key_template)
+        reduced = set()
 
-        for name in self._names:
-            key.append(kwargs.pop(name, slice(None)))
+        for name, token in kwargs.items():
+            try:
+                axis = self._axes[name]
+            except KeyError:
+                raise KeyError('Unknown axis name %r, expected one of %r' % (name, tuple(self._names or ())))
 
-        return tuple(key)
+            key[axis] = token
 
-    def _reduce_names(self, key):
-        result = []
+            if not isinstance(token, (slice, list)):
+                reduced.add(axis)
 
-        for name, token in zip(self._names, key):
-            if isinstance(token, (slice, list)):
-                result.append(name)
+        if not reduced:
+            return tuple(key), self._names
 
-        return tuple(result)
+        return tuple(key), tuple(name for axis, name in enumerate(self._names) if axis not in reduced)
 
 
 class NamedMultiDict(MultiDict, _NamedMixin):
     def __init__(self, data=None, headers=None, names=None):
         super(NamedMultiDict, self).__init__(data, headers)
-        self._names = names
+        self._init_names(names)
 
     def map_values(self, function):
         return NamedMultiDict(map_values(function, self._items), self._headers, self._names)
@@ -311,7 +561,7 @@ class NamedMultiDict(MultiDict, _NamedMixin):
 class _NamedMultiDictViewDecorator(_DictView, _NamedMixin):
     def __init__(self, view, names):
         self._view = view
-        self._names = names
+        self._init_names(names)
 
     def __getitem__(self, item):
         return self._view[item]
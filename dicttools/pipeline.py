@@ -0,0 +1,120 @@
+from .functions import _resolve_selector_kind
+
+
+class Pipeline(object):
+    """
+    Chain of dict operations, which are executed in single pass over items, when the result is collected.
+    Intermediate dicts are not created, only the final one::
+
+        >>> Pipeline({'a': 1, 'b': 2}).merge({'c': 3}).sift(lambda v: v > 1).map_values(lambda v: v * 10).collect()
+        {'b': 20, 'c': 30}
+
+    Each operation returns a new pipeline, so the pipeline can be reused and extended.
+    The source dicts are read when the pipeline is collected or iterated.
+
+    When map_keys maps many keys to the same key, all items are passed to the next operations
+    and the last one which reaches the end is kept.
+    """
+
+    def __init__(self, source, stages=()):
+        """
+        :param source: dict (or other mapping), which items are processed
+        """
+        self._source = source
+        self._stages = tuple(stages)
+
+    def _then(self, stage):
+        return Pipeline(self._source, self._stages + (stage,))
+
+    def merge(self, other, func=None):
+        """
+        Merge other dict into items, like merge function: value is taken from other dict, or if func is given,
+        it is used to merge values with the same key. Keys which are only in other dict are appended at the end.
+
+        :param other: dict to merge
+        :param func: two arguments function used to merge duplicate values (default value from other dict)
+        """
+        return self._then(lambda items: _merge(items, other, func))
+
+    def sift(self, condition, opposite=False, by=None):
+        """
+        Keep only items for which the condition is True, like sift function.
+
+        :param condition: function (name matters): key -> bool or  value -> bool or key, value -> bool)
+            selected remain elements
+        :param opposite: if True replace "condition" by "not condition" (default False)
+        :param by: 'key', 'value' or 'item' - what is given to condition (default determined by condition signature)
+        """
+        by = _resolve_selector_kind(condition, by)
+        opposite = bool(opposite)
+
+        if by == 'key':
+            stage = lambda items: ((k, v) for k, v in items if opposite != bool(condition(k)))
+        elif by == 'value':
+            stage = lambda items: ((k, v) for k, v in items if opposite != bool(condition(v)))
+        else:
+            stage = lambda items: ((k, v) for k, v in items if opposite != bool(condition(k, v)))
+
+        return self._then(stage)
+
+    def map_values(self, function):
+        """
+        Transform each value using the given function, like map_values function.
+
+        :param function: values map function
+        """
+        return self._then(lambda items: ((k, function(v)) for k, v in items))
+
+    def map_keys(self, function):
+        """
+        Transform each key using the given function, like map_keys function.
+
+        :param function: keys map function
+        """
+        return self._then(lambda items: ((function(k), v) for k, v in items))
+
+    def select(self, *keys):
+        """
+        Keep only items with the given keys. Unlike select function, keys which are not found are ignored,
+        and the order of items is not changed.
+
+        :param keys: keys which should be selected
+        """
+        keys = frozenset(keys)
+        return self._then(lambda items: ((k, v) for k, v in items if k in keys))
+
+    def __iter__(self):
+        items = iter(self._source.items())
+
+        for stage in self._stages:
+            items = stage(items)
+
+        return items
+
+    def collect(self, into=dict):
+        """
+        Execute all operations and create the result.
+
+        :param into: type of result, which can be created from iterable of key-value pairs (default dict)
+        :return: result of given type
+        """
+        return into(iter(self))
+
+    def __repr__(self):
+        return 'Pipeline(%r, %d stages)' % (self._source, len(self._stages))
+
+
+def _merge(items, other, func):
+    seen = set()
+
+    for key, value in items:
+        seen.add(key)
+
+        if key in other:
+            value = other[key] if func is None else func(value, other[key])
+
+        yield key, value
+
+    for key, value in other.items():
+        if key not in seen:
+            yield key, value
@@ -0,0 +1,64 @@
+from __future__ import absolute_import
+
+import array
+import unittest
+
+try:
+    import numpy
+    import dicttools.columnar
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class ColumnarTests(unittest.TestCase):
+    def test_By_KeyRepeats_ReturnDictWithValueFromLast(self):
+        result = dicttools.columnar.by(numpy.array([1, 2, 1]), numpy.array([10, 20, 30]))
+
+        self.assertEqual({1: 30, 2: 20}, result)
+
+    def test_By_ArrayModuleColumns_ReturnDictWithPythonValues(self):
+        result = dicttools.columnar.by(array.array('i', [1, 2]), array.array('d', [0.5, 1.5]))
+
+        self.assertEqual({1: 0.5, 2: 1.5}, result)
+        self.assertIs(float, type(result[1]))
+
+    def test_By_ColumnsLengthMismatch_Throws(self):
+        with self.assertRaises(ValueError):
+            dicttools.columnar.by([1, 2, 3], [10, 20])
+
+    def test_GroupBy_Always_ReturnValuesGroupedInOriginalOrder(self):
+        result = dicttools.columnar.group_by(numpy.array(['b', 'a', 'b', 'a', 'b']), numpy.array([1, 2, 3, 4, 5]))
+
+        self.assertEqual({'a', 'b'}, set(result))
+        self.assertEqual([1, 3, 5], result['b'].tolist())
+
+    def test_GroupBy_EmptyColumns_ReturnEmptyDict(self):
+        result = dicttools.columnar.group_by(numpy.array([]), numpy.array([]))
+
+        self.assertEqual({}, result)
+
+    def test_MapValues_Always_ApplyFunctionToAllValues(self):
+        result = dicttools.columnar.map_values(lambda v: v * 2, [1, 2], [10, 20])
+
+        self.assertEqual({1: 20, 2: 40}, result)
+
+    def test_MapKeys_Always_ApplyFunctionToAllKeys(self):
+        result = dicttools.columnar.map_keys(lambda k: k + 1, [1, 2], [10, 20])
+
+        self.assertEqual({2: 10, 3: 20}, result)
+
+    def test_Sift_ByItem_GiveKeysAndValuesToCondition(self):
+        result = dicttools.columnar.sift([1, 2, 3], [1, 5, 3], lambda k, v: k == v, by='item')
+
+        self.assertEqual({1: 1, 3: 3}, result)
+
+    def test_Sift_Opposite_ReturnElementsNotFulfillingCondition(self):
+        result = dicttools.columnar.sift([1, 2, 3], [10, 20, 30], lambda k: k % 2 == 1, opposite=True)
+
+        self.assertEqual({2: 20}, result)
+
+    def test_FillValue_Always_AssignValueToEachKey(self):
+        result = dicttools.columnar.fill_value(numpy.array([1, 2]), 'a')
+
+        self.assertEqual({1: 'a', 2: 'a'}, result)
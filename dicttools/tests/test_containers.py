@@ -483,6 +483,22 @@ class TwoWayDictTest(unittest.TestCase):
         result = set(iter(container))
         self.assertEqual({'delta', 'beta'}, result)
 
+    def test_Init_ValueIsAlsoKey_KeepTheSameAssociationsAsAssignments(self):
+        container = self.create({'a': 'b', 'b': 'c', 'x': 'x'})
+
+        expected = self.create()
+        expected['a'] = 'b'
+        expected['b'] = 'c'
+        expected['x'] = 'x'
+
+        self.assertEqual(dict(expected), dict(container))
+
+    def test_Init_UniqueValues_BothEntriesAccessible(self):
+        container = self.create({'a': 1, 'b': 2, 'x': 'x'})
+
+        self.assertEqual('b', container[2])
+        self.assertEqual(5, len(container))
+
     def test_Str_OnePair_ReturnStringWithKeyValuesPairsAsSimpleDict(self):
         container = self.create()
 
@@ -509,3 +525,51 @@ class TwoWayDictTest(unittest.TestCase):
     @staticmethod
     def create(*args, **kwargs):
         return dicttools.TwoWayDict(*args, **kwargs)
+
+
+class ReverseIndexTest(unittest.TestCase):
+    def test_FindKeys_ValueDuplicated_ReturnAllKeys(self):
+        index = self.create({'h': 1, 'a': 2, 'l': 3, 'x': 1})
+
+        self.assertEqual({'h', 'x'}, set(index.find_keys(1)))
+
+    def test_FindKeys_ValueNotContained_ReturnEmptyList(self):
+        index = self.create({'h': 1})
+
+        self.assertEqual([], index.find_keys(2))
+
+    def test_FindKeys_UnhashableValue_ReturnKeys(self):
+        index = self.create({'h': [1], 'a': [2]})
+
+        self.assertEqual(['a'], index.find_keys([2]))
+
+    def test_FindKey_ValueNotContained_ReturnDefault(self):
+        index = self.create({'h': 1})
+
+        self.assertEqual('y', index.find_key(2, default='y'))
+
+    def test_Add_NewKey_FoundByValue(self):
+        index = self.create()
+
+        index.add('a', 1)
+
+        self.assertEqual('a', index.find_key(1))
+
+    def test_Discard_LastKeyOfValue_ValueNotContained(self):
+        index = self.create({'h': 1})
+
+        index.discard('h', 1)
+
+        self.assertNotIn(1, index)
+        self.assertEqual(0, len(index))
+
+    def test_Discard_UnhashableValue_RemoveOnlyGivenPair(self):
+        index = self.create({'h': [1], 'a': [1]})
+
+        index.discard('h', [1])
+
+        self.assertEqual(['a'], index.find_keys([1]))
+
+    @staticmethod
+    def create(*args, **kwargs):
+        return dicttools.ReverseIndex(*args, **kwargs)
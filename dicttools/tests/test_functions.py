@@ -8,7 +8,10 @@ except ImportError:
     from unittest import mock
 
 import dicttools
+from dicttools.multidimensional import MultiDict
 import collections
+import concurrent.futures
+import six
 
 
 def is_even(i):
@@ -42,6 +45,11 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual(-18, result['X'])
 
+    def test_Merge_KeyRepeatsInOtherMapping_MergeFuncIsSum_ReturnDictWithAddedDuplicatedValues(self):
+        result = dicttools.merge(lambda x, y: x + y, {'a': 1}, dicttools.FrozenDict(a=2, b=3))
+
+        self.assertEqual({'a': 3, 'b': 3}, result)
+
     def test_Merge_NoneGivenAsThridArgument_IgnoreNones(self):
         result = dicttools.merge({'A': 1}, {'B': 2}, None, {'C': 3})
 
@@ -85,6 +93,67 @@ class DictToolsTests(unittest.TestCase):
         self.assertIsInstance(actual, collections.OrderedDict)
         self.assertEqual(expected, actual)
 
+    def test_MergeMany_GeneratorGiven_ReturnDictContainingEachElement(self):
+        result = dicttools.merge_many({str(i): i} for i in range(3))
+
+        self.assertEqual({'0': 0, '1': 1, '2': 2}, result)
+
+    def test_MergeMany_FuncGiven_MergeOnlyDuplicatedValues(self):
+        func = mock.Mock(side_effect=lambda x, y: x + y)
+
+        result = dicttools.merge_many(iter([{'A': 1, 'X': 8}, None, {'B': 2, 'X': 14}]), func)
+
+        self.assertEqual({'A': 1, 'B': 2, 'X': 22}, result)
+        func.assert_called_once_with(8, 14)
+
+    def test_MergeMany_EmptyIterable_ReturnEmptyDict(self):
+        result = dicttools.merge_many(iter([]))
+
+        self.assertEqual({}, result)
+
+    def test_DeepMerge_NestedDicts_MergeRecursively(self):
+        result = dicttools.deep_merge({'a': {'x': {'i': 1}, 'y': 2}}, {'a': {'x': {'j': 3}}}, {'b': 4})
+
+        expected = {'a': {'x': {'i': 1, 'j': 3}, 'y': 2}, 'b': 4}
+        self.assertEqual(expected, result)
+
+    def test_DeepMerge_Always_DoNotModifyGivenDicts(self):
+        first, second = {'a': {'x': 1}}, {'a': {'y': 2}}
+
+        dicttools.deep_merge(first, second)
+
+        self.assertEqual({'a': {'x': 1}}, first)
+        self.assertEqual({'a': {'y': 2}}, second)
+
+    def test_DeepMerge_SubtreeOnlyInOneDict_ShareSubtree(self):
+        subtree = {'x': {'y': 1}}
+
+        result = dicttools.deep_merge({'a': 1}, {'b': subtree})
+
+        self.assertIs(subtree, result['b'])
+
+    def test_DeepMerge_FuncGiven_MergeDuplicatedValues(self):
+        result = dicttools.deep_merge({'a': {'x': 1}}, {'a': {'x': 2}}, func=lambda x, y: x + y)
+
+        self.assertEqual({'a': {'x': 3}}, result)
+
+    def test_DeepMerge_VeryDeepDicts_DoNotExceedRecursionLimit(self):
+        first, second = {}, {}
+        left, right = first, second
+
+        for _ in range(5000):
+            left['n'], right['n'] = {}, {}
+            left, right = left['n'], right['n']
+
+        right['leaf'] = 1
+
+        result = dicttools.deep_merge(first, second)
+
+        for _ in range(5000):
+            result = result['n']
+
+        self.assertEqual({'leaf': 1}, result)
+
     def test_ByKey_Always_ReturnDictWithValuesAssignedToExtractedKey(self):
         values = (mock.Mock(id=3), mock.Mock(id=6))
 
@@ -108,6 +177,22 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual(expected, result)
 
+    def test_Split_ManyConditions_ElementInFirstMatchingResult(self):
+        elements = {0: 'A', 1: 'B', 2: 'C', 3: 'D', 4: 'E', 5: 'F'}
+
+        result = list(dicttools.split(elements, lambda i: i % 3 == 0, lambda v: v in 'ABC', lambda k, v: k > 3))
+        expected = [{0: 'A', 3: 'D'}, {1: 'B', 2: 'C'}, {4: 'E', 5: 'F'}, {}]
+
+        self.assertEqual(expected, result)
+
+    def test_SplitEager_RestIsFalse_ReturnListWithoutRest(self):
+        elements = {0: 'A', 1: 'B', 2: 'C', 3: 'D', 4: 'E'}
+
+        result = dicttools.split_eager(elements, lambda i: i % 3 == 0, lambda i: i % 3 == 1, rest=False)
+        expected = [{0: 'A', 3: 'D'}, {1: 'B', 4: 'E'}]
+
+        self.assertEqual(expected, result)
+
     def test_Sift_SiftEventKey_ResultShouldContainOnlyEvenElements(self):
         elements = {0: 'A', 1: 'B', 2: 'C', 3: 'D', 4: 'E'}
 
@@ -148,6 +233,69 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual(expected, result)
 
+    def test_Sift_ByValueGiven_GiveValueToCondition(self):
+        elements = {0: 'A', 1: None, 2: 'C'}
+
+        result = dicttools.sift(elements, bool, by='value')
+
+        self.assertEqual({0: 'A', 2: 'C'}, result)
+
+    def test_Sift_UnknownBy_Throws(self):
+        with self.assertRaises(ValueError):
+            dicttools.sift({0: 'A'}, is_even, by='keys')
+
+    def test_Sift_BoundMethodWithValueArgument_GiveValueToCondition(self):
+        class Checker(object):
+            def check(self, value):
+                return value is not None
+
+        result = dicttools.sift({0: None, 1: 'B'}, Checker().check)
+
+        self.assertEqual({1: 'B'}, result)
+
+    def test_Sift_BuiltinCondition_GiveKeyToCondition(self):
+        result = dicttools.sift({0: 'A', 1: 'B'}, bool)
+
+        self.assertEqual({1: 'B'}, result)
+
+    def test_SiftUpdate_ByItemGiven_GiveKeyAndValueToCondition(self):
+        elements = {0: 0, 1: 2, 2: 2}
+
+        dicttools.sift_update(elements, lambda *item: item[0] == item[1], by='item')
+
+        self.assertEqual({0: 0, 2: 2}, elements)
+
+    def test_SiftUpdate_MostElementsRemoved_KeepOrderOfRemaining(self):
+        elements = collections.OrderedDict((i, str(i)) for i in reversed(range(1000)))
+
+        dicttools.sift_update(elements, lambda k: k % 100 == 0)
+
+        self.assertIsInstance(elements, collections.OrderedDict)
+        self.assertEqual([900, 800, 700, 600, 500, 400, 300, 200, 100, 0], list(elements))
+        self.assertEqual('500', elements[500])
+
+    def test_SiftUpdate_ManyElements_CallConditionOncePerElement(self):
+        elements = dict.fromkeys(range(1000), 'A')
+        condition = mock.Mock(side_effect=lambda k: k < 900)
+
+        dicttools.sift_update(elements, condition, by='key')
+
+        self.assertEqual(1000, condition.call_count)
+        self.assertEqual(900, len(elements))
+
+    def test_SiftUpdate_NothingRemoved_DoNotChangeDict(self):
+        elements = {0: 'A', 2: 'C'}
+
+        dicttools.sift_update(elements, is_even)
+
+        self.assertEqual({0: 'A', 2: 'C'}, elements)
+
+    def test_Contains_SuperIsMultiDict_CheckKeyByKey(self):
+        instance = MultiDict.from_flat({(1, 'A'): 2, (2, 'B'): 3})
+
+        self.assertTrue(dicttools.contains({(1, 'A'): 2}, instance))
+        self.assertFalse(dicttools.contains({(1, 'A'): 3}, instance))
+
     def test_Contains_EmptyDict_ReturnTrue(self):
         elements = {0: 'A', 1: 'B', 2: 'C', 3: 'D', 4: 'E'}
 
@@ -190,6 +338,26 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertFalse(result)
 
+    def test_Contains_UnhashableValues_CompareValues(self):
+        result = dicttools.contains({0: [1], 1: {'a': 2}}, {0: [1], 1: {'a': 2}, 2: 'C'})
+
+        self.assertTrue(result)
+
+    def test_DeepContains_NestedSubDict_ReturnTrue(self):
+        sup = {0: {'a': 1, 'b': {'c': 2, 'd': 3}}, 1: 'B'}
+        sub = {0: {'b': {'d': 3}}}
+
+        self.assertTrue(dicttools.deep_contains(sub, sup))
+
+    def test_DeepContains_NestedValueMismatch_ReturnFalse(self):
+        sup = {0: {'a': 1, 'b': {'c': 2, 'd': 3}}, 1: 'B'}
+        sub = {0: {'b': {'d': 4}}}
+
+        self.assertFalse(dicttools.deep_contains(sub, sup))
+
+    def test_DeepContains_DictInSubAndValueInSuper_ReturnFalse(self):
+        self.assertFalse(dicttools.deep_contains({0: {'a': 1}}, {0: 'A'}))
+
     def test_Swap_Always_ReplacedValuesWithKeys(self):
         elements = {0: 'A', 1: 'B', 2: 'C'}
 
@@ -204,6 +372,35 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual({0: 'A', 1: 'B', 2: 'C', 'A': 0, 'B': 1, 'C': 2}, result)
 
+    def test_Swap_DuplicatedValuesAndFirstPolicy_KeepFirstKey(self):
+        result = dicttools.swap({0: 'A', 1: 'B', 2: 'A'}, on_duplicate='first')
+
+        self.assertEqual({'A': 0, 'B': 1}, result)
+
+    def test_Swap_DuplicatedValuesAndErrorPolicy_Throws(self):
+        with self.assertRaisesRegexp(ValueError, "'A'"):
+            dicttools.swap({0: 'A', 1: 'B', 2: 'A'}, on_duplicate='error')
+
+    def test_Swap_DuplicatedValuesAndCollectPolicy_ReturnListsOfKeys(self):
+        result = dicttools.swap({0: 'A', 1: 'B', 2: 'A'}, on_duplicate='collect')
+
+        self.assertEqual({'A': [0, 2], 'B': [1]}, result)
+
+    def test_Swap_UnknownPolicy_Throws(self):
+        with self.assertRaises(ValueError):
+            dicttools.swap({0: 'A'}, on_duplicate='all')
+
+    def test_TwoWay_ValueIsAlsoKey_KeepGivenAssociation(self):
+        result = dicttools.two_way({'A': 'B', 'B': 'C'})
+
+        self.assertEqual({'A': 'B', 'B': 'C', 'C': 'B'}, result)
+
+    def test_TwoWay_AsContainer_ReturnTwoWayDict(self):
+        result = dicttools.two_way({0: 'A', 1: 'B'}, as_container=True)
+
+        self.assertIsInstance(result, dicttools.TwoWayDict)
+        self.assertEqual(1, result['B'])
+
     def test_GroupBy_Always_ReturnDictOfListElementGroupedByGivenAttribute(self):
         values = (mock.Mock(id=3, sort='1'), mock.Mock(id=6, sort='2'), mock.Mock(id=4, sort='1'))
 
@@ -219,6 +416,99 @@ class DictToolsTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = result['3']
 
+    def test_GroupBy_ThreadExecutorGiven_ReturnTheSameGroupsInTheSameOrder(self):
+        values = [complex(i % 3, i) for i in range(10)]
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            result = dicttools.group_by('real', values, executor=executor, chunksize=3)
+
+        expected = dicttools.group_by('real', values)
+        self.assertEqual(list(expected.items()), list(result.items()))
+
+    def test_GroupBy_ProcessExecutorGiven_ReturnTheSameGroups(self):
+        values = [complex(i % 3, i) for i in range(10)]
+
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            result = dicttools.group_by('real', values, executor=executor, chunksize=4)
+
+        self.assertEqual(dicttools.group_by('real', values), result)
+
+    def test_ByKey_ExecutorGivenWithZeroChunkSize_Throws(self):
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(ValueError):
+                dicttools.by('real', [1j, 2j], executor=executor, chunksize=0)
+
+    def test_GroupBy_ExecutorGivenWithNegativeChunkSize_Throws(self):
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(ValueError):
+                dicttools.group_by('real', [1j, 2j], executor=executor, chunksize=-1)
+
+    def test_ByKey_ExecutorGiven_KeyRepeats_ReturnDictWithLastElement(self):
+        values = [complex(i % 3, i) for i in range(10)]
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            result = dicttools.by('real', values, executor=executor, chunksize=3)
+
+        self.assertEqual({0.0: 9j, 1.0: 1 + 7j, 2.0: 2 + 8j}, result)
+
+    def test_ReduceBy_MutatingReducerWithInitial_EachGroupGetsOwnInitial(self):
+        actual = dicttools.reduce_by(len, ['a', 'bc', 'd'], lambda total, word: total.append(word) or total, initial=[])
+
+        self.assertEqual({1: ['a', 'd'], 2: ['bc']}, actual)
+
+    def test_ReduceBy_ByDefault_ReturnCountOfElementsInGroups(self):
+        result = dicttools.reduce_by(len, iter(['a', 'bc', 'de', 'f', 'g']))
+
+        self.assertEqual({1: 3, 2: 2}, result)
+
+    def test_ReduceBy_Sum_ReturnSumOfElementsInGroups(self):
+        result = dicttools.reduce_by(is_even, iter([1, 2, 3, 4, 5]), 'sum')
+
+        self.assertEqual({False: 9, True: 6}, result)
+
+    def test_ReduceBy_First_ReturnFirstElementOfGroups(self):
+        result = dicttools.reduce_by(len, ['a', 'bc', 'de', 'f'], 'first')
+
+        self.assertEqual({1: 'a', 2: 'bc'}, result)
+
+    def test_ReduceBy_FunctionWithInitialGiven_ReduceFromInitial(self):
+        result = dicttools.reduce_by(len, ['a', 'bc', 'de'], lambda total, word: total + [word], initial=[])
+
+        self.assertEqual({1: ['a'], 2: ['bc', 'de']}, result)
+
+    def test_ReduceBy_UnknownReducer_Throws(self):
+        with self.assertRaises(ValueError):
+            dicttools.reduce_by(len, ['a'], 'max')
+
+    def test_StreamGroupBy_NoLimit_YieldGroupsInOrderOfOccurrence(self):
+        result = [(key, list(group)) for key, group in dicttools.stream_group_by(len, iter(['bc', 'a', 'de', 'f']))]
+
+        self.assertEqual([(2, ['bc', 'de']), (1, ['a', 'f'])], result)
+
+    def test_StreamGroupBy_LimitExceeded_YieldTheSameGroups(self):
+        elements = [complex(i % 3, i) for i in range(20)]
+
+        result = [(key, list(group)) for key, group in dicttools.stream_group_by('real', iter(elements), 3)]
+
+        expected = list(dicttools.group_by('real', elements).items())
+        self.assertEqual(expected, result)
+
+    def test_StreamGroupBy_LimitExceededAndGroupsReadAfterExhausted_YieldTheSameGroups(self):
+        elements = [complex(i % 3, i) for i in range(20)]
+
+        groups = list(dicttools.stream_group_by('real', iter(elements), 3))
+
+        expected = list(dicttools.group_by('real', elements).items())
+        self.assertEqual(expected, [(key, list(group)) for key, group in groups])
+
+    def test_StreamGroupBy_LimitExceededAndGroupsReadAlternately_YieldTheSameGroups(self):
+        elements = [complex(i % 2, i) for i in range(20)]
+        (_, first), (_, second) = dicttools.stream_group_by('real', iter(elements), 3)
+
+        result = list(zip(first, second))
+
+        self.assertEqual([(complex(0, i), complex(1, i + 1)) for i in range(0, 20, 2)], result)
+
     def test_Extract_KeyNotGiven_ReturnDictWithAttributes(self):
         source = mock.Mock(first=1, second=2, third=3)
 
@@ -241,6 +531,55 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual({'a': 1, 'c': 4}, result)
 
+    def test_Projector_Always_GetFromDictGivenItems(self):
+        project = dicttools.projector('a', 'c')
+
+        self.assertEqual({'a': 1, 'c': 4}, project({'a': 1, 'b': 2, 'c': 4}))
+
+    def test_Projector_KeysAsIterable_GetFromDictGivenItems(self):
+        project = dicttools.projector(['a'])
+
+        self.assertEqual({'a': 1}, project({'a': 1, 'b': 2}))
+
+    def test_Projector_KeyNotInDictAndMissingNotGiven_Throws(self):
+        project = dicttools.projector('a', 'c')
+
+        with self.assertRaises(KeyError):
+            project({'a': 1})
+
+    def test_Projector_GetattrGivenAndAttributeMissed_UseMissingValue(self):
+        project = dicttools.projector('real', 'imag', 'other', key=getattr, missing=None)
+
+        self.assertEqual({'real': 1.0, 'imag': 2.0, 'other': None}, project(1 + 2j))
+
+    def test_Projector_SingleStringGiven_UseItAsOneKey(self):
+        project = dicttools.projector('real', key=getattr)
+
+        self.assertEqual({'real': 1.0}, project(1 + 2j))
+
+    def test_Projector_GetattrGivenAndAttributeMissed_ResolveDottedNamesOfOtherKeys(self):
+        project = dicttools.projector('value.real', 'other', key=getattr, missing=None)
+
+        self.assertEqual({'value.real': 1.0, 'other': None}, project(mock.Mock(spec=['value'], value=1 + 2j)))
+
+    def test_Projector_CustomKeyGiven_UseKeyToExtract(self):
+        def caesar(source, item):
+            return getattr(source, chr(ord(item) + 1))
+
+        project = dicttools.projector('h', 'a', key=caesar)
+
+        self.assertEqual({'h': 2, 'a': 3}, project(mock.Mock(i=2, b=3)))
+
+    def test_ProjectorStream_SomeKeysMissed_ProjectEachRecord(self):
+        project = dicttools.projector('a', 'b', missing=0)
+        records = ({'a': i, 'b': i} if i % 700 else {'a': i} for i in range(3000))
+
+        actual = list(project.stream(records))
+
+        self.assertEqual(3000, len(actual))
+        self.assertEqual({'a': 700, 'b': 0}, actual[700])
+        self.assertEqual({'a': 701, 'b': 701}, actual[701])
+
     def test_MapValues_Always_ReturnValuesWithTheSameKeysAndMappedValues(self):
         source = {'a': 1, 'b': 2, 'c': 4}
 
@@ -255,6 +594,42 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual({'i': 1, 'b': 2, 'm': 3}, result)
 
+    def test_MapValuesUpdate_Always_ReplaceValuesInPlace(self):
+        source = {'a': 1, 'b': 2, 'c': 4}
+
+        dicttools.map_values_update(lambda v: v + 1, source)
+
+        self.assertEqual({'a': 2, 'b': 3, 'c': 5}, source)
+
+    def test_MapKeysUpdate_Always_ReplaceKeysInPlace(self):
+        source = {'h': 1, 'a': 2, 'l': 3}
+
+        dicttools.map_keys_update(lambda v: chr(ord(v) + 1), source)
+
+        self.assertEqual({'i': 1, 'b': 2, 'm': 3}, source)
+
+    def test_MapKeysUpdate_MappedKeyCollidesWithNotMappedYet_ReturnTheSameAsMapKeys(self):
+        source = {1: 'a', 2: 'b', 3: 'c'}
+
+        expected = dicttools.map_keys(lambda k: k + 1, source)
+        dicttools.map_keys_update(lambda k: k + 1, source)
+
+        self.assertEqual(expected, source)
+
+    def test_MergeInto_FuncGiven_UpdateTargetInPlace(self):
+        target = {'A': 1, 'X': 8}
+
+        dicttools.merge_into(target, {'B': 2, 'X': 14}, None, {'X': 12}, func=lambda x, y: x + y)
+
+        self.assertEqual({'A': 1, 'B': 2, 'X': 34}, target)
+
+    def test_MergeInto_FuncNotGiven_TakeValuesFromLast(self):
+        target = {'A': 1, 'X': 8}
+
+        dicttools.merge_into(target, {'B': 2, 'X': 14}, {'X': 12})
+
+        self.assertEqual({'A': 1, 'B': 2, 'X': 12}, target)
+
     def test_FindKey_ValueNotInDict_ReturnDefaultValue(self):
         elements = {'h': 1, 'a': 2, 'l': 3}
 
@@ -276,6 +651,13 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual(1, elements[result])
 
+    def test_FindKeys_ValueDuplicatedInDict_ReturnAllKeysForGivenValue(self):
+        elements = {'h': 1, 'a': 2, 'l': 3, 'x': 1}
+
+        result = dicttools.find_keys(1, elements)
+
+        self.assertEqual(['h', 'x'], result)
+
     def test_FillValue_NoKeys_ReturnEmptyDict(self):
         actual = dicttools.fill_value([], 'val')
 
@@ -291,6 +673,60 @@ class DictToolsTests(unittest.TestCase):
         }
         self.assertEqual(expected, actual)
 
+    def test_FillFactory_ListGiven_ReturnNotSharedValues(self):
+        actual = dicttools.fill_factory(iter(['alpha', 'beta']), list)
+        actual['alpha'].append(1)
+
+        self.assertEqual({'alpha': [1], 'beta': []}, actual)
+
+    def test_FillFactory_Always_CallFactoryOncePerKey(self):
+        factory = mock.Mock(return_value=0)
+
+        dicttools.fill_factory(['alpha', 'beta', 'gamma'], factory)
+
+        self.assertEqual(3, factory.call_count)
+
+    def test_ZipDict_KeyRepeats_TakeLastValue(self):
+        actual = dicttools.zip_dict(['a', 'b', 'a'], [1, 2, 3])
+
+        self.assertEqual({'a': 3, 'b': 2}, actual)
+
+    def test_ZipDict_DifferentLengths_Throws(self):
+        with self.assertRaises(ValueError):
+            dicttools.zip_dict(['a', 'b'], [1])
+
+    def test_FromColumns_ColumnsGiven_ReturnDictForEachPosition(self):
+        actual = dicttools.from_columns(name=('a', 'b'), size=[1, 2])
+
+        self.assertEqual([{'name': 'a', 'size': 1}, {'name': 'b', 'size': 2}], actual)
+
+    def test_FromColumns_NoColumns_ReturnEmptyList(self):
+        self.assertEqual([], dicttools.from_columns())
+
+    def test_FromColumns_DifferentLengths_Throws(self):
+        with self.assertRaises(ValueError):
+            dicttools.from_columns(name=['a', 'b'], size=[1])
+
+    def test_ToColumns_KeyMissing_InsertDefault(self):
+        actual = dicttools.to_columns([{'name': 'a', 'size': 1}, {'name': 'b'}], default=0)
+
+        self.assertEqual({'name': ['a', 'b'], 'size': [1, 0]}, actual)
+
+    def test_ToColumns_KeysGiven_ReturnOnlyGivenColumns(self):
+        actual = dicttools.to_columns(iter([{'name': 'a', 'size': 1}]), keys=['size'])
+
+        self.assertEqual({'size': [1]}, actual)
+
+    def test_ToColumns_ResultOfFromColumns_ReturnTheSameColumns(self):
+        columns = {'name': ['a', 'b'], 'size': [1, 2]}
+
+        actual = dicttools.to_columns(dicttools.from_columns(**columns))
+
+        self.assertEqual(columns, actual)
+
+    def test_ToColumns_NoDicts_ReturnEmptyDict(self):
+        self.assertEqual({}, dicttools.to_columns([]))
+
     def test_Stringify_SingleLevelDict_ReturnSortedKeysWithValues(self):
         d = {"a": 1, "c": 3, "b": 2}
         actual = dicttools.stringify(d)
@@ -304,6 +740,113 @@ class DictToolsTests(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_Stringify_EmptyDict_ReturnEmptyBraces(self):
+        self.assertEqual('{}', dicttools.stringify({}))
+
+    def test_Stringify_VeryDeepDict_DoNotExceedRecursionLimit(self):
+        d = inner = {}
+
+        for _ in range(5000):
+            inner['a'] = {}
+            inner = inner['a']
+
+        actual = dicttools.stringify(d)
+
+        self.assertEqual('{a:' * 5000 + '{}' + '}' * 5000, actual)
+
+    def test_Stringify_MemoGiven_ReturnTheSameAndRememberSharedDict(self):
+        shared = {"y": 2, "x": 1}
+        d = {"b": shared, "a": {"c": shared}}
+        memo = {}
+
+        actual = dicttools.stringify(d, memo=memo)
+
+        self.assertEqual("{a:{c:{x:1, y:2}}, b:{x:1, y:2}}", actual)
+        self.assertEqual("{x:1, y:2}", memo[id(shared)][1])
+
+    def test_StringifyTo_LargeDict_WriteTheSameAsStringify(self):
+        d = {i: {"v": i} for i in range(10000)}
+        stream = six.StringIO()
+
+        dicttools.stringify_to(stream, d)
+
+        self.assertEqual(dicttools.stringify(d, memo={}), stream.getvalue())
+
+    def test_StringifyTo_WideFlatDict_WriteInManyParts(self):
+        d = {i: i for i in range(100000)}
+        stream = mock.Mock()
+
+        dicttools.stringify_to(stream, d)
+
+        pieces = [args[0] for args, _ in stream.write.call_args_list]
+        self.assertGreater(len(pieces), 10)
+        self.assertLess(max(map(len, pieces)), 100000)
+        self.assertEqual(dicttools.stringify(d), ''.join(pieces))
+
+    def test_Fingerprint_EqualNestedDictsInDifferentOrder_ReturnTheSame(self):
+        d1 = {'a': {'x': [1, {'y': 2, 'z': 3}]}, 'b': {1, 2}, 'c': 'C'}
+        d2 = {'c': 'C', 'b': {2, 1}, 'a': {'x': [1, {'z': 3, 'y': 2}]}}
+
+        self.assertEqual(dicttools.fingerprint(d1), dicttools.fingerprint(d2))
+
+    def test_Fingerprint_NestedValueDiffers_ReturnDifferent(self):
+        d1 = {'a': {'x': [1, {'y': 2}]}}
+        d2 = {'a': {'x': [1, {'y': 3}]}}
+
+        self.assertNotEqual(dicttools.fingerprint(d1), dicttools.fingerprint(d2))
+
+    def test_Fingerprint_ListAndTupleOfTheSameValues_ReturnDifferent(self):
+        self.assertNotEqual(dicttools.fingerprint({'a': [1, 2]}), dicttools.fingerprint({'a': (1, 2)}))
+
+    def test_Fingerprint_FrozenDictEqualToDict_ReturnTheSame(self):
+        d = {'a': {'x': 1}, 'b': 2}
+        frozen = dicttools.FrozenDict(b=2, a=dicttools.FrozenDict(x=1))
+
+        self.assertEqual(dicttools.fingerprint(d), dicttools.fingerprint(frozen))
+
+    def test_Fingerprint_KeysOfDifferentTypes_ReturnTheSameForAnyOrder(self):
+        d1 = {1: 'a', 'b': 2, (3, 4): None}
+        d2 = {(3, 4): None, 'b': 2, 1: 'a'}
+
+        self.assertEqual(dicttools.fingerprint(d1), dicttools.fingerprint(d2))
+
+    def test_Fingerprint_AlgorithmGiven_ReturnDigestOfGivenAlgorithm(self):
+        actual = dicttools.fingerprint({'a': 1}, algorithm='md5')
+
+        self.assertEqual(32, len(actual))
+
+    def test_Fingerprint_NamedTupleValue_ReturnTheSameAsForTuple(self):
+        Point = collections.namedtuple('Point', 'x, y')
+
+        self.assertEqual(dicttools.fingerprint({'k': (1, 2)}), dicttools.fingerprint({'k': Point(1, 2)}))
+
+    def test_Fingerprint_NotSupportedType_Throws(self):
+        with self.assertRaises(TypeError):
+            dicttools.fingerprint({'k': [object()]})
+
+    def test_Fingerprint_DefaultGiven_ConvertNotSupportedValues(self):
+        class Id(object):
+            def __init__(self, value):
+                self.value = value
+
+        actual = dicttools.fingerprint({'k': [Id(1), Id(2)]}, default=lambda each: each.value)
+
+        self.assertEqual(dicttools.fingerprint({'k': [1, 2]}), actual)
+
+    def test_Fingerprint_RecordsWithTheSameKeys_ReturnTheSameAsForFrozenDicts(self):
+        records = {i: {'id': i, 'tags': ['a', (i, {'x': i})]} for i in range(10)}
+        frozen = {i: dicttools.FrozenDict(tags=['a', (i, dicttools.FrozenDict(x=i))], id=i) for i in range(10)}
+
+        self.assertEqual(dicttools.fingerprint(records), dicttools.fingerprint(frozen))
+
+    def test_Fingerprint_DeeplyNested_ReturnDigest(self):
+        nested = 1
+
+        for _ in range(400):
+            nested = {'x': [nested]}
+
+        self.assertTrue(dicttools.fingerprint(nested))
+
     def test_ListOfValues_WithoutDefault_ReturnNoneForMissedValues(self):
         actual = dicttools.list_of_values({"a": 1, "b": 2, "d": 4}, ["d", "c", "b", "a"])
         expected = [4, None, 2, 1]
@@ -315,3 +858,40 @@ class DictToolsTests(unittest.TestCase):
         expected = [4, 0, 2, 1]
 
         self.assertEqual(expected, actual)
+
+    def test_ValuesGetter_AllKeysPresent_ReturnTupleOfValues(self):
+        get = dicttools.values_getter(["d", "b", "a"])
+
+        self.assertEqual((4, 2, 1), get({"a": 1, "b": 2, "d": 4}))
+
+    def test_ValuesGetter_KeyMissed_ReturnDefaultValueForMissedValues(self):
+        get = dicttools.values_getter(["d", "c"], default=0)
+
+        self.assertEqual((4, 0), get({"a": 1, "d": 4}))
+
+    def test_ValuesGetter_SingleKey_ReturnOneElementTuple(self):
+        get = dicttools.values_getter(["a"])
+
+        self.assertEqual((1,), get({"a": 1}))
+
+    def test_ValuesGetterRows_SomeKeysMissed_ReturnRowForEachDict(self):
+        get = dicttools.values_getter(["a", "b"])
+        dicts = ({"a": i, "b": i} if i % 700 else {"a": i} for i in range(3000))
+
+        actual = get.rows(dicts)
+
+        self.assertEqual(3000, len(actual))
+        self.assertEqual((700, None), actual[700])
+        self.assertEqual((701, 701), actual[701])
+
+    def test_ValuesGetterColumns_Always_ReturnColumnForEachKey(self):
+        get = dicttools.values_getter(["a", "b"])
+
+        actual = get.columns([{"a": 1, "b": 2}, {"a": 3}])
+
+        self.assertEqual([[1, 3], [2, None]], actual)
+
+    def test_ValuesGetterColumns_NoDicts_ReturnEmptyColumns(self):
+        get = dicttools.values_getter(["a", "b"])
+
+        self.assertEqual([[], []], get.columns([]))
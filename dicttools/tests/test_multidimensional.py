@@ -1,8 +1,11 @@
 from __future__ import absolute_import
 
+import collections
 import unittest
 import dicttools.multidimensional
 
+Event = collections.namedtuple('Event', 'day, kind, size')
+
 
 class MultiDictTest(unittest.TestCase):
     def test_GetItem_1Dimension_ReturnAssignedValue(self):
@@ -66,6 +69,78 @@ class MultiDictTest(unittest.TestCase):
         self.assertEqual(2, len(actual))
         self.assertEqual(14, actual['C'])
 
+    def test_GetItem_ChainedViews_ReturnValue(self):
+        instance = self.from_flat({
+            (1, 'A', 'x'): 1,
+            (1, 'B', 'x'): 2,
+            (1, 'B', 'y'): 3,
+            (1, 'B', 'z'): 4,
+            (2, 'B', 'x'): 5,
+        })
+
+        view = instance[1][:, ['x', 'y']]['B']
+
+        self.assertEqual(2, len(view))
+        self.assertEqual(3, view['y'])
+
+    def test_GetItem_ListNotInView_Throws(self):
+        instance = self.create([
+            [12, 13, 14],
+            [25, 34, 35],
+        ], headers=[[1, 2], ['A', 'B', 'C']])
+
+        view = instance[1, ['A', 'B']]
+
+        with self.assertRaises(KeyError):
+            actual = view[['A', 'C']]
+
+    def test_GetItem_SliceInView_SelectOnlyElementsInView(self):
+        instance = self.create([
+            [12, 13, 14],
+            [25, 34, 35],
+        ], headers=[[1, 2], ['A', 'B', 'C']])
+
+        view = instance[1, 'B':]
+
+        actual = view['A':'C']
+
+        self.assertEqual(1, len(actual))
+        self.assertEqual(13, actual['B'])
+
+    def test_Reduce_HeadersGrowAfterViewCreated_ViewContainsNewElements(self):
+        instance = self.create([
+            [12, 13],
+            [25, 34],
+        ], headers=[[1, 2], ['A', 'B']])
+
+        view = instance[1]
+        _ = len(view)
+
+        instance[1, 'C'] = 14
+
+        self.assertEqual(3, len(view))
+
+    def test_TokenIndex_Slice_ReturnRangeOfIndices(self):
+        instance = self.create([
+            [12, 13, 14],
+            [25, 34, 35],
+        ], headers=[[1, 2], ['A', 'B', 'C']])
+
+        actual = instance.token_index(slice('B', None), 1)
+
+        self.assertEqual([1, 2], list(actual))
+
+    def test_GetItem_SliceBoundNotInHeaders_Throws(self):
+        instance = self.create([
+            [12, 13, 14],
+            [25, 34, 35],
+        ], headers=[[1, 2], ['A', 'B', 'C']])
+
+        view = instance[1, 'A':'X']
+
+        with self.assertRaises(KeyError):
+            actual = len(view)
+
     def test_Contains_KeyInDict_ReturnTrue(self):
         instance = self.create([
             [12, 13, 14],
@@ -249,7 +324,112 @@ class MultiDictTest(unittest.TestCase):
 
         self.assertEqual(4, actual[2]['B'])
 
+    def test_Eq_SameLabelsInDifferentHeadersOrder_ReturnTrue(self):
+        dict1 = self.create([
+            [12, 13],
+            [25, 34],
+        ], headers=[[1, 2], ['A', 'B']])
+
+        dict2 = self.create([
+            [34, 25],
+            [13, 12],
+        ], headers=[[2, 1], ['B', 'A']])
+
+        self.assertEqual(dict1, dict2)
+
+    def test_Eq_DifferentValue_ReturnFalse(self):
+        dict1 = self.from_flat({(1, 'A'): 12, (2, 'B'): 34})
+        dict2 = self.from_flat({(1, 'A'): 12, (2, 'B'): 35})
+
+        self.assertNotEqual(dict1, dict2)
+
+    def test_Eq_ListWithMissingElement_ReturnFalse(self):
+        instance = self.create([
+            [12, 13],
+            [25, 34],
+        ])
+
+        self.assertNotEqual([[12, 13], [25]], instance)
+
+    def test_Digest_SameContentInDifferentOrder_ReturnEqualDigests(self):
+        dict1 = self.from_flat({(1, 'A'): 12, (2, 'B'): 34})
+        dict2 = self.from_flat({(2, 'B'): 34, (1, 'A'): 12})
+
+        self.assertEqual(dict1.digest, dict2.digest)
+
+    def test_Digest_ValueReplaced_UpdatedIncrementally(self):
+        instance = self.from_flat({(1, 'A'): 12, (2, 'B'): 34})
+        _ = instance.digest
+
+        instance[2, 'B'] = 35
+
+        expected = self.from_flat({(1, 'A'): 12, (2, 'B'): 35}).digest
+        self.assertEqual(expected, instance.digest)
+
+    def test_Digest_UnhashableValue_ReturnNone(self):
+        instance = self.from_flat({(1, 'A'): [12]})
+
+        self.assertIsNone(instance.digest)
+
+    def test_Digest_UnhashableValueReplaced_ReturnDigest(self):
+        instance = self.from_flat({(1, 'A'): 12, (2, 'B'): 34})
+        _ = instance.digest
+
+        instance[2, 'B'] = [34]
+        instance[2, 'B'] = 35
+
+        expected = self.from_flat({(1, 'A'): 12, (2, 'B'): 35}).digest
+        self.assertEqual(expected, instance.digest)
+
+    def test_Eq_SameHeaders_ReturnTrue(self):
+        dict1 = self.create([[12, 13], [25, 34]], headers=[[1, 2], ['A', 'B']])
+        dict2 = self.create([[12, 13], [25, 34]], headers=[[1, 2], ['A', 'B']])
+
+        self.assertEqual(dict1, dict2)
+
+    def test_Eq_LabelMissingInOther_ReturnFalse(self):
+        dict1 = self.create([[12, 13], [25, 34]], headers=[[1, 2], ['A', 'B']])
+        dict2 = self.create([[12, 13], [25, 34]], headers=[[1, 3], ['A', 'B']])
+
+        self.assertNotEqual(dict1, dict2)
+
+    def test_Eq_ListGivenToCustomHeaders_CompareByPositionsNotLabels(self):
+        instance = self.create([[1, 2], [3, 4]], headers=[['b', 'a'], ['x', 'y']])
+
+        self.assertEqual(instance, [[1, 2], [3, 4]])
+        self.assertNotEqual(instance, self.create([[1, 2], [3, 4]]))
+
+    def test_Pivot_AggGiven_ReturnAggregatedValues(self):
+        events = [Event(1, 'A', 3), Event(1, 'B', 4), Event(2, 'A', 5), Event(1, 'A', 6)]
+
+        actual = self.pivot(events, ['day', 'kind'], value='size', agg=lambda x, y: x + y)
+
+        self.assertEqual(3, len(actual))
+        self.assertEqual(9, actual[1, 'A'])
+
+    def test_Pivot_AggNotGiven_ReturnListsOfValues(self):
+        events = [Event(1, 'A', 3), Event(1, 'B', 4), Event(1, 'A', 6)]
+
+        actual = self.pivot(events, [lambda e: e.kind], value='size')
+
+        self.assertEqual([3, 6], actual['A'])
+
+    def test_Pivot_Always_HeadersInOrderOfFirstOccurrence(self):
+        events = [Event(2, 'B', 3), Event(1, 'A', 4), Event(2, 'A', 6)]
+
+        actual = self.pivot(events, ['day', 'kind'])
+
+        self.assertEqual((2, 2), actual.shape)
+        self.assertEqual((0, 0), actual.key_index((2, 'B')))
+
+    def test_Pivot_NoRecords_ReturnEmptyDictWithGivenNumberOfAxes(self):
+        actual = self.pivot([], ['day', 'kind'])
+
+        self.assertEqual(0, len(actual))
+        self.assertEqual(2, actual.size)
+
     create = staticmethod(dicttools.multidimensional.MultiDict)
+    pivot = staticmethod(dicttools.multidimensional.MultiDict.pivot)
     from_flat = staticmethod(dicttools.multidimensional.MultiDict.from_flat)
 
 
@@ -320,4 +500,22 @@ class NamedMultiDictTest(unittest.TestCase):
 
         self.assertEqual(4, actual.get(row=2, column='B'))
 
+    def test_Get_UnknownAxisName_Throws(self):
+        instance = self.create([
+            [12, 13],
+            [25, 34],
+        ], [[1, 2], ['A', 'B']], ['row', 'column'])
+
+        with self.assertRaises(KeyError):
+            instance.get(row=2, col='B')
+
+    def test_Get_UnknownAxisNameInView_Throws(self):
+        instance = self.create([
+            [12, 13],
+            [25, 34],
+        ], [[1, 2], ['A', 'B']], ['row', 'column'])
+
+        with self.assertRaises(KeyError):
+            instance.get(row=2).get(row=1)
+
     create = staticmethod(dicttools.multidimensional.NamedMultiDict)
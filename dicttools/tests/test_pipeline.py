@@ -0,0 +1,65 @@
+from __future__ import absolute_import
+
+import unittest
+
+import dicttools
+
+
+class PipelineTest(unittest.TestCase):
+    def test_Collect_NoStages_ReturnCopyOfSource(self):
+        source = {'a': 1, 'b': 2}
+
+        actual = self.create(source).collect()
+
+        self.assertEqual(source, actual)
+        self.assertIsNot(source, actual)
+
+    def test_Collect_SiftAndMapValues_ReturnTheSameAsFunctions(self):
+        source = {0: 'A', 1: 'B', 2: 'C', 3: 'D'}
+
+        actual = self.create(source).sift(lambda i: i % 2 == 0).map_values(str.lower).collect()
+
+        expected = dicttools.map_values(str.lower, dicttools.sift(source, lambda i: i % 2 == 0))
+        self.assertEqual(expected, actual)
+
+    def test_Collect_MergeThenSiftByValue_SiftMergedValues(self):
+        actual = self.create({'a': 1, 'b': 5}).merge({'a': 7, 'c': 2}).sift(lambda v: v > 4).collect()
+
+        self.assertEqual({'a': 7, 'b': 5}, actual)
+
+    def test_Collect_MergeWithFunc_MergeDuplicatedValues(self):
+        actual = self.create({'a': 1, 'b': 5}).merge({'a': 7}, lambda x, y: x + y).collect()
+
+        self.assertEqual({'a': 8, 'b': 5}, actual)
+
+    def test_Collect_MergeAfterSift_DoNotSiftMergedDict(self):
+        actual = self.create({'a': 1, 'b': 5}).sift(lambda v: v > 4).merge({'c': 0}).collect()
+
+        self.assertEqual({'b': 5, 'c': 0}, actual)
+
+    def test_Collect_MapKeysAndSelect_ReturnSelectedMappedKeys(self):
+        actual = self.create({'h': 1, 'a': 2, 'l': 3}).map_keys(lambda k: chr(ord(k) + 1)).select('i', 'm').collect()
+
+        self.assertEqual({'i': 1, 'm': 3}, actual)
+
+    def test_Collect_IntoGiven_ReturnResultOfGivenType(self):
+        actual = self.create({'a': 1}).map_values(lambda v: v + 1).collect(into=dicttools.FrozenDict)
+
+        self.assertEqual(dicttools.FrozenDict(a=2), actual)
+
+    def test_Sift_Always_ReturnNewPipeline(self):
+        pipeline = self.create({'a': 1, 'b': 2})
+
+        pipeline.sift(lambda v: v > 1)
+
+        self.assertEqual({'a': 1, 'b': 2}, pipeline.collect())
+
+    def test_Collect_SourceChanged_ReadCurrentItems(self):
+        source = {'a': 1}
+        pipeline = self.create(source).map_values(lambda v: v * 2)
+
+        source['b'] = 2
+
+        self.assertEqual({'a': 2, 'b': 4}, pipeline.collect())
+
+    create = staticmethod(dicttools.Pipeline)
@@ -0,0 +1,103 @@
+from __future__ import absolute_import
+
+import unittest
+
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+import dicttools
+
+
+class MappedValuesViewTest(unittest.TestCase):
+    def test_GetItem_Always_ReturnMappedValue(self):
+        view = self.create(lambda v: v + 1, {'a': 1, 'b': 2})
+
+        self.assertEqual(3, view['b'])
+
+    def test_GetItem_KeyNotInDict_Throws(self):
+        view = self.create(lambda v: v + 1, {'a': 1})
+
+        with self.assertRaises(KeyError):
+            _ = view['b']
+
+    def test_GetItem_NotMemoized_CallFunctionOnEachAccess(self):
+        function = mock.Mock(return_value=5)
+        view = self.create(function, {'a': 1, 'b': 2})
+
+        _, _ = view['a'], view['a']
+
+        self.assertEqual(2, function.call_count)
+
+    def test_GetItem_Memoized_CallFunctionOnceForKey(self):
+        function = mock.Mock(return_value=5)
+        view = self.create(function, {'a': 1, 'b': 2}, memoize=True)
+
+        _, _ = view['a'], view['a']
+
+        function.assert_called_once_with(1)
+
+    def test_Dict_Always_ReturnDictWithMappedValues(self):
+        view = self.create(lambda v: v + 1, {'a': 1, 'b': 2})
+
+        self.assertEqual({'a': 2, 'b': 3}, dict(view))
+
+    def test_Len_Always_ReturnLengthOfDict(self):
+        view = self.create(lambda v: v + 1, {'a': 1, 'b': 2})
+
+        self.assertEqual(2, len(view))
+
+    def test_GetItem_DictChanged_ReturnMappedNewValue(self):
+        source = {'a': 1}
+        view = self.create(lambda v: v + 1, source)
+
+        source['a'] = 5
+
+        self.assertEqual(6, view['a'])
+
+    create = staticmethod(dicttools.MappedValuesView)
+
+
+class SiftedViewTest(unittest.TestCase):
+    def test_GetItem_ConditionFulfilled_ReturnValue(self):
+        view = self.create({0: 'A', 1: 'B', 2: 'C'}, lambda i: i % 2 == 0)
+
+        self.assertEqual('C', view[2])
+
+    def test_GetItem_ConditionNotFulfilled_Throws(self):
+        view = self.create({0: 'A', 1: 'B', 2: 'C'}, lambda i: i % 2 == 0)
+
+        with self.assertRaises(KeyError):
+            _ = view[1]
+
+    def test_Contains_ConditionNotFulfilled_ReturnFalse(self):
+        view = self.create({0: 'A', 1: 'B', 2: 'C'}, lambda i: i % 2 == 0)
+
+        self.assertNotIn(1, view)
+        self.assertIn(0, view)
+
+    def test_Dict_Always_ReturnTheSameAsSift(self):
+        source = {0: None, 1: 'B', 2: None, 3: 'D'}
+        condition = lambda k, v: v is not None
+
+        view = self.create(source, condition)
+
+        self.assertEqual(dicttools.sift(source, condition), dict(view))
+
+    def test_Dict_Opposite_ReturnTheSameAsSiftOpposite(self):
+        source = {0: 'A', 1: 'B', 2: 'C'}
+
+        view = self.create(source, lambda value: value == 'B', opposite=True)
+
+        self.assertEqual({0: 'A', 2: 'C'}, dict(view))
+
+    def test_Len_Memoized_CallConditionOnceForKey(self):
+        condition = mock.Mock(return_value=True)
+        view = self.create({0: 'A', 1: 'B'}, condition, by='key', memoize=True)
+
+        _, _ = len(view), len(view)
+
+        self.assertEqual(2, condition.call_count)
+
+    create = staticmethod(dicttools.SiftedView)
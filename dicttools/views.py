@@ -0,0 +1,134 @@
+from .functions import _resolve_selector_kind, _matches
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class MappedValuesView(Mapping):
+    """
+    Lazy version of map_values. Read-only view of dict with each value transformed by the given function
+    on access, so values which are not read are not computed::
+
+        >>> view = MappedValuesView(lambda v: v * 10, {'a': 1, 'b': 2})
+        >>> view['b']
+        20
+        >>> dict(view)
+        {'a': 10, 'b': 20}
+
+    View follows changes of the given dict. When memoize is set, each value is computed only once
+    (changes of already read values are not followed then).
+    """
+
+    def __init__(self, function, dictionary, memoize=False):
+        """
+        :param function: values map function
+        :param dictionary: dictionary to mapping
+        :param memoize: if True keep computed values (default False)
+        """
+        self._function = function
+        self._dictionary = dictionary
+        self._memo = {} if memoize else None
+
+    def __getitem__(self, key):
+        if self._memo is None:
+            return self._function(self._dictionary[key])
+
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = self._function(self._dictionary[key])
+            return value
+
+    def __iter__(self):
+        return iter(self._dictionary)
+
+    def __len__(self):
+        return len(self._dictionary)
+
+    def __contains__(self, key):
+        return key in self._dictionary
+
+    def __repr__(self):
+        return 'MappedValuesView(%r, %r)' % (self._function, self._dictionary)
+
+
+class SiftedView(Mapping):
+    """
+    Lazy version of sift. Read-only view of dict with only elements, for which the condition is True.
+    Condition is called on access, so elements which are not read are not checked::
+
+        >>> view = SiftedView({0: 'A', 1: 'B', 2: 'C', 3: 'D'}, lambda i: i % 2 == 0)
+        >>> view[2]
+        'C'
+        >>> 1 in view
+        False
+        >>> dict(view)
+        {0: 'A', 2: 'C'}
+
+    View follows changes of the given dict. Length requires checking all elements. When memoize is set,
+    result of the condition for each key is computed only once.
+    """
+
+    def __init__(self, dictionary, condition, opposite=False, by=None, memoize=False):
+        """
+        :param dictionary: set of elements to select subset
+        :param condition: function (name matters): key -> bool or  value -> bool or key, value -> bool)
+            selected remain elements
+        :param opposite: if True replace "condition" by "not condition" (default False)
+        :param by: 'key', 'value' or 'item' - what is given to condition (default determined by condition signature)
+        :param memoize: if True keep results of condition (default False)
+        """
+        self._dictionary = dictionary
+        self._condition = condition
+        self._opposite = bool(opposite)
+        self._by = _resolve_selector_kind(condition, by)
+        self._memo = {} if memoize else None
+
+    def __getitem__(self, key):
+        value = self._dictionary[key]
+
+        if not self._selected(key, value):
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+
+        return True
+
+    def _selected(self, key, value):
+        if self._memo is not None and key in self._memo:
+            return self._memo[key]
+
+        if self._by == 'key':
+            match = self._condition(key)
+        elif self._by == 'value':
+            match = self._condition(value)
+        else:
+            match = self._condition(key, value)
+
+        result = self._opposite != bool(match)
+
+        if self._memo is not None:
+            self._memo[key] = result
+
+        return result
+
+    def __iter__(self):
+        if self._memo is not None:
+            return (key for key, value in self._dictionary.items() if self._selected(key, value))
+
+        matches = _matches(self._dictionary, self._condition, self._by)
+        return (key for key, match in zip(self._dictionary, matches) if self._opposite != bool(match))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return 'SiftedView(%r, %r)' % (self._dictionary, self._condition)
@@ -11,6 +11,9 @@ setup(
     author_email='leszek.trzemecki@gmail.com',
     description='Additional dictionary functions for python.',
     install_requires=[
-        'mock', 'six'
+        'mock', 'six', 'futures; python_version < "3"'
     ],
+    extras_require={
+        'columnar': ['numpy'],
+    },
 )